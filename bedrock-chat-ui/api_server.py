@@ -1,321 +1,448 @@
-#!/usr/bin/env python3
-"""
-Strands Agents API Server - FastAPI wrapper for AWS deployment
-
-This server exposes the Strands Agents (Router + AWS Pricing Agent) as REST API endpoints
-for integration with the Amplify frontend.
-"""
-
-import os
-import sys
-import time
-import logging
-import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional
-from contextlib import asynccontextmanager
-
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-# Global orchestrator instance
-orchestrator = None
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager for startup and shutdown."""
-    global orchestrator
-    
-    # Startup
-    logger.info("Starting Strands Agents API Server...")
-    try:
-        from agents.router_orchestrator import RouterOrchestrator
-        orchestrator = RouterOrchestrator()
-        logger.info("Router Orchestrator initialized successfully")
-        yield
-    except Exception as e:
-        logger.error(f"Failed to initialize orchestrator: {str(e)}")
-        # Continue with limited functionality
-        yield
-    finally:
-        # Shutdown
-        logger.info("Shutting down Strands Agents API Server...")
-        if orchestrator:
-            orchestrator.reset_conversation_context()
-
-# Create FastAPI app
-app = FastAPI(
-    title="Strands Agents API",
-    description="AI-powered AWS pricing analysis with MCP integration",
-    version="1.0.0",
-    lifespan=lifespan
-)
-
-# CORS middleware for Amplify frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "https://main.d1uq2rdehqninx.amplifyapp.com",  # Correct Amplify URL
-        "https://*.amplifyapp.com",
-    ],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"],
-)
-
-# Request/Response Models
-class ChatRequest(BaseModel):
-    message: str = Field(..., description="User message to process")
-    user_id: Optional[str] = Field(None, description="Optional user identifier")
-
-class ChatResponse(BaseModel):
-    id: str = Field(..., description="Unique response identifier")
-    content: str = Field(..., description="Agent response content")
-    role: str = Field(default="assistant", description="Response role")
-    timestamp: str = Field(..., description="Response timestamp")
-    agent_type: Optional[str] = Field(None, description="Agent that handled the request")
-    intent_analysis: Optional[Dict[str, Any]] = Field(None, description="Intent classification results")
-    orchestration_metadata: Optional[Dict[str, Any]] = Field(None, description="Orchestration metadata")
-
-class HealthResponse(BaseModel):
-    status: str = Field(..., description="Service health status")
-    timestamp: str = Field(..., description="Health check timestamp")
-    orchestration: Optional[Dict[str, Any]] = Field(None, description="Orchestration status")
-    mcp_status: Optional[Dict[str, Any]] = Field(None, description="MCP server status")
-
-# API Endpoints
-
-@app.get("/", response_model=Dict[str, str])
-async def root():
-    """Root endpoint with API information."""
-    return {
-        "service": "Strands Agents API",
-        "version": "1.0.0",
-        "description": "AI-powered AWS pricing analysis with MCP integration",
-        "endpoints": {
-            "chat": "/router-chat",
-            "health": "/health",
-            "status": "/status"
-        }
-    }
-
-@app.post("/router-chat", response_model=ChatResponse)
-async def router_chat(request: ChatRequest):
-    """
-    Process chat message through the Router Orchestrator.
-    
-    This endpoint routes messages to appropriate specialized agents
-    (AWS Pricing Agent, General Agent, etc.) based on intent analysis.
-    """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=503, 
-            detail="Router Orchestrator not available. Service may be starting up."
-        )
-    
-    try:
-        logger.info(f"Processing chat request: {request.message[:100]}...")
-        
-        # Process query through orchestrator
-        response = await orchestrator.process_query(
-            request.message, 
-            request.user_id
-        )
-        
-        # Create response
-        chat_response = ChatResponse(
-            id=f"assistant-{int(time.time() * 1000)}",
-            content=response.get('content', 'No response generated'),
-            role="assistant",
-            timestamp=datetime.now().isoformat(),
-            agent_type=response.get('agent_type'),
-            intent_analysis=response.get('intent_analysis'),
-            orchestration_metadata=response.get('orchestration_metadata')
-        )
-        
-        logger.info(f"Response generated by {chat_response.agent_type}")
-        return chat_response
-        
-    except Exception as e:
-        logger.error(f"Error processing chat request: {str(e)}")
-        
-        # Return error response in expected format
-        error_response = ChatResponse(
-            id=f"error-{int(time.time() * 1000)}",
-            content=f"""I encountered an error while processing your request. Here's what happened:
-
-**Error**: {str(e)}
-
-**What you can try**:
-- Rephrase your question with more specific details
-- If asking about AWS costs, mention specific services (EC2, RDS, S3, etc.)
-- Try breaking complex questions into smaller parts
-- Check if you're asking about supported AWS services
-
-**I'm still here to help!** Please try again with a different approach.""",
-            role="assistant",
-            timestamp=datetime.now().isoformat(),
-            agent_type="error_handler",
-            intent_analysis={
-                "intent": "error_response",
-                "confidence": "high",
-                "error_handled": True
-            }
-        )
-        
-        return error_response
-
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """
-    Health check endpoint for load balancer and monitoring.
-    
-    Returns service health status and orchestration information.
-    """
-    global orchestrator
-    
-    try:
-        health_response = HealthResponse(
-            status="healthy",
-            timestamp=datetime.now().isoformat()
-        )
-        
-        if orchestrator:
-            # Get orchestration status
-            orchestration_status = orchestrator.get_orchestration_status()
-            health_response.orchestration = orchestration_status
-            
-            # Check MCP status if available
-            try:
-                # Try to get AWS Pricing Agent status
-                from agents.aws_pricing_agent_optimized import AWSPricingAgentOptimized
-                pricing_agent = AWSPricingAgentOptimized()
-                
-                health_response.mcp_status = {
-                    "aws_pricing_mcp_available": pricing_agent.pricing_mcp_client is not None,
-                    "performance_stats": getattr(pricing_agent, 'performance_stats', {}),
-                    "connection_status": getattr(pricing_agent, 'mcp_connection_status', 'unknown')
-                }
-            except Exception as e:
-                health_response.mcp_status = {
-                    "aws_pricing_mcp_available": False,
-                    "error": str(e)
-                }
-        else:
-            health_response.status = "degraded"
-            health_response.orchestration = {"error": "Orchestrator not initialized"}
-        
-        return health_response
-        
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        raise HTTPException(status_code=503, detail=f"Health check failed: {str(e)}")
-
-@app.get("/status", response_model=Dict[str, Any])
-async def service_status():
-    """
-    Detailed service status endpoint for monitoring and debugging.
-    """
-    global orchestrator
-    
-    try:
-        status = {
-            "service": "Strands Agents API",
-            "version": "1.0.0",
-            "timestamp": datetime.now().isoformat(),
-            "environment": {
-                "aws_region": os.getenv("AWS_REGION", "us-east-1"),
-                "bedrock_model": os.getenv("BEDROCK_MODEL_ID", "amazon.nova-lite-v1:0"),
-                "python_version": sys.version,
-                "working_directory": os.getcwd()
-            }
-        }
-        
-        if orchestrator:
-            status["orchestration"] = orchestrator.get_orchestration_status()
-        else:
-            status["orchestration"] = {"status": "not_initialized"}
-        
-        # Check agent availability
-        try:
-            from agents.aws_pricing_agent_optimized import AWSPricingAgentOptimized
-            pricing_agent = AWSPricingAgentOptimized()
-            
-            status["agents"] = {
-                "aws_pricing_agent": {
-                    "available": True,
-                    "mcp_client_available": pricing_agent.pricing_mcp_client is not None,
-                    "performance_stats": getattr(pricing_agent, 'performance_stats', {})
-                }
-            }
-        except Exception as e:
-            status["agents"] = {
-                "aws_pricing_agent": {
-                    "available": False,
-                    "error": str(e)
-                }
-            }
-        
-        return status
-        
-    except Exception as e:
-        logger.error(f"Status check failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
-
-# Error handlers
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal server error",
-            "detail": str(exc),
-            "timestamp": datetime.now().isoformat()
-        }
-    )
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Additional startup tasks."""
-    logger.info("Strands Agents API Server started successfully")
-    logger.info(f"Environment: AWS_REGION={os.getenv('AWS_REGION', 'us-east-1')}")
-    logger.info(f"Bedrock Model: {os.getenv('BEDROCK_MODEL_ID', 'amazon.nova-lite-v1:0')}")
-
-# Main entry point
-if __name__ == "__main__":
-    import uvicorn
-    
-    # Configuration
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "8000"))
-    log_level = os.getenv("LOG_LEVEL", "info")
-    
-    logger.info(f"Starting server on {host}:{port}")
-    
-    # Run server
-    uvicorn.run(
-        "api_server:app",
-        host=host,
-        port=port,
-        log_level=log_level,
-        reload=False,  # Disable reload in production
-        access_log=True
+#!/usr/bin/env python3
+"""
+Strands Agents API Server - FastAPI wrapper for AWS deployment
+
+This server exposes the Strands Agents (Router + AWS Pricing Agent) as REST API endpoints
+for integration with the Amplify frontend.
+"""
+
+import os
+import re
+import sys
+import time
+import logging
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; uvicorn falls back to the asyncio loop
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; responses fall back to the stdlib encoder
+    orjson = None
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+# Resolve the optional pricing agent once instead of inside each probe
+try:
+    from agents.aws_pricing_agent_optimized import AWSPricingAgentOptimized
+    _pricing_agent_import_error = None
+except ImportError as e:
+    AWSPricingAgentOptimized = None
+    _pricing_agent_import_error = str(e)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Worker threads for the loop's default executor
+EXECUTOR_MAX_WORKERS = int(os.getenv("EXECUTOR_MAX_WORKERS", "4"))
+
+# Global orchestrator instance
+orchestrator = None
+
+# The registry's AWS Pricing Agent, looked up for /pricing-chat/stream on first use
+streaming_pricing_agent = None
+_streaming_pricing_agent_lock = asyncio.Lock()
+
+# (epoch second, ISO string) pair reused until the clock ticks over
+_iso_cache = (0, "")
+
+def _iso_now() -> str:
+    """Return the current local time as an ISO string at one-second resolution."""
+    global _iso_cache
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        _iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _iso_cache[1]
+
+def _response_stamp(prefix: str) -> Tuple[str, str]:
+    """Return a (response id, ISO timestamp) pair taken from a single clock read."""
+    now = time.time()
+    return f"{prefix}-{int(now * 1000)}", datetime.fromtimestamp(now).isoformat()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager for startup and shutdown."""
+    global orchestrator
+    
+    # Startup
+    logger.info("Starting Strands Agents API Server...")
+    logger.info(f"Environment: AWS_REGION={os.getenv('AWS_REGION', 'us-east-1')}")
+    logger.info(f"Bedrock Model: {os.getenv('BEDROCK_MODEL_ID', 'amazon.nova-lite-v1:0')}")
+    
+    # Small shared pool for short blocking calls; model calls use the pricing agent's own pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="fastapi-blk")
+    )
+    
+    # Run new tasks eagerly until their first await (Python 3.12+)
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    # Build the pricing agent once for the /health and /status probes
+    app.state.pricing_agent = None
+    app.state.pricing_agent_error = _pricing_agent_import_error
+    if AWSPricingAgentOptimized is not None:
+        try:
+            app.state.pricing_agent = AWSPricingAgentOptimized()
+        except Exception as e:
+            app.state.pricing_agent_error = str(e)
+    if app.state.pricing_agent is None:
+        logger.warning(f"AWS Pricing Agent unavailable for status probes: {app.state.pricing_agent_error}")
+    
+    try:
+        from agents.router_orchestrator import RouterOrchestrator
+        orchestrator = RouterOrchestrator()
+        logger.info("Router Orchestrator initialized successfully")
+        yield
+    except Exception as e:
+        logger.error(f"Failed to initialize orchestrator: {str(e)}")
+        # Continue with limited functionality
+        yield
+    finally:
+        # Shutdown
+        logger.info("Shutting down Strands Agents API Server...")
+        if orchestrator:
+            orchestrator.reset_conversation_context()
+            orchestrator.close()
+        if streaming_pricing_agent is not None:
+            streaming_pricing_agent.close()
+
+# Create FastAPI app
+app = FastAPI(
+    title="Strands Agents API",
+    description="AI-powered AWS pricing analysis with MCP integration",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson else JSONResponse
+)
+
+# Amplify app whose branch deployments may call the API with credentials
+AMPLIFY_APP_ID = os.getenv("AMPLIFY_APP_ID", "d1uq2rdehqninx")
+
+# CORS middleware for Amplify frontend
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[
+        "http://localhost:3000",
+        f"https://main.{AMPLIFY_APP_ID}.amplifyapp.com",  # Correct Amplify URL
+    ],
+    # Starlette matches origins literally, so this app's branch previews need a regex;
+    # one label per branch, never another Amplify app's domain
+    allow_origin_regex=rf"https://[a-z0-9-]+\.{re.escape(AMPLIFY_APP_ID)}\.amplifyapp\.com",
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["*"],
+)
+
+# Opt-in request profiling: set ENABLE_PROFILE=1, then add ?profile=1 to any request
+if os.getenv("ENABLE_PROFILE") == "1":
+    from pyinstrument import Profiler
+    from fastapi.responses import HTMLResponse
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        """Return a pyinstrument HTML report for the request instead of its response."""
+        if not request.query_params.get("profile"):
+            return await call_next(request)
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+# Request/Response Models
+class ChatRequest(BaseModel):
+    message: str = Field(..., description="User message to process")
+    user_id: Optional[str] = Field(None, description="Optional user identifier")
+
+class ChatResponse(BaseModel):
+    id: str = Field(..., description="Unique response identifier")
+    content: str = Field(..., description="Agent response content")
+    role: str = Field(default="assistant", description="Response role")
+    timestamp: str = Field(..., description="Response timestamp")
+    agent_type: Optional[str] = Field(None, description="Agent that handled the request")
+    intent_analysis: Optional[Dict[str, Any]] = Field(None, description="Intent classification results")
+    orchestration_metadata: Optional[Dict[str, Any]] = Field(None, description="Orchestration metadata")
+
+class HealthResponse(BaseModel):
+    status: str = Field(..., description="Service health status")
+    timestamp: str = Field(..., description="Health check timestamp")
+    orchestration: Optional[Dict[str, Any]] = Field(None, description="Orchestration status")
+    mcp_status: Optional[Dict[str, Any]] = Field(None, description="MCP server status")
+
+# Static parts of the router_chat error response (treat as read-only)
+ERROR_RESPONSE_TEMPLATE = """I encountered an error while processing your request. Here's what happened:
+
+**Error**: {error}
+
+**What you can try**:
+- Rephrase your question with more specific details
+- If asking about AWS costs, mention specific services (EC2, RDS, S3, etc.)
+- Try breaking complex questions into smaller parts
+- Check if you're asking about supported AWS services
+
+**I'm still here to help!** Please try again with a different approach."""
+
+ERROR_INTENT_ANALYSIS = {
+    "intent": "error_response",
+    "confidence": "high",
+    "error_handled": True
+}
+
+# API Endpoints
+
+@app.get("/", response_model=Dict[str, str])
+async def root():
+    """Root endpoint with API information."""
+    return {
+        "service": "Strands Agents API",
+        "version": "1.0.0",
+        "description": "AI-powered AWS pricing analysis with MCP integration",
+        "endpoints": {
+            "chat": "/router-chat",
+            "pricing_stream": "/pricing-chat/stream",
+            "health": "/health",
+            "status": "/status"
+        }
+    }
+
+@app.post("/router-chat", response_model=ChatResponse)
+async def router_chat(request: ChatRequest):
+    """
+    Process chat message through the Router Orchestrator.
+    
+    This endpoint routes messages to appropriate specialized agents
+    (AWS Pricing Agent, General Agent, etc.) based on intent analysis.
+    """
+    global orchestrator
+    
+    if not orchestrator:
+        raise HTTPException(
+            status_code=503, 
+            detail="Router Orchestrator not available. Service may be starting up."
+        )
+    
+    try:
+        logger.info(f"Processing chat request: {request.message[:100]}...")
+        
+        # Process query through orchestrator
+        response = await orchestrator.process_query(
+            request.message, 
+            request.user_id
+        )
+        
+        # Create response (server-built fields, so skip Pydantic validation)
+        response_id, timestamp = _response_stamp("assistant")
+        chat_response = ChatResponse.model_construct(
+            id=response_id,
+            content=response.get('content', 'No response generated'),
+            role="assistant",
+            timestamp=timestamp,
+            agent_type=response.get('agent_type'),
+            intent_analysis=response.get('intent_analysis'),
+            orchestration_metadata=response.get('orchestration_metadata')
+        )
+        
+        logger.info(f"Response generated by {chat_response.agent_type}")
+        return chat_response
+        
+    except Exception as e:
+        logger.error(f"Error processing chat request: {str(e)}")
+        
+        # Return error response in expected format
+        response_id, timestamp = _response_stamp("error")
+        error_response = ChatResponse.model_construct(
+            id=response_id,
+            content=ERROR_RESPONSE_TEMPLATE.format(error=str(e)),
+            role="assistant",
+            timestamp=timestamp,
+            agent_type="error_handler",
+            intent_analysis=ERROR_INTENT_ANALYSIS
+        )
+        
+        return error_response
+
+async def _get_streaming_pricing_agent():
+    """
+    Get the agent registry's AWS Pricing Agent rather than building a second one.
+    
+    The registry creates it on first use, and its __init__ probes MCP with blocking
+    calls, so the lookup runs off the event loop.
+    """
+    global streaming_pricing_agent
+    if streaming_pricing_agent is None:
+        # Concurrent first requests wait for one lookup instead of each probing MCP
+        async with _streaming_pricing_agent_lock:
+            if streaming_pricing_agent is None:
+                from agents.agent_registry import get_agent_registry
+                from agents.aws_pricing_agent import _AGENT_EXECUTOR
+                agent = await asyncio.get_running_loop().run_in_executor(
+                    _AGENT_EXECUTOR, get_agent_registry().get_agent, "aws_pricing"
+                )
+                if agent is None:
+                    raise RuntimeError("agent registry could not create aws_pricing")
+                streaming_pricing_agent = agent
+    return streaming_pricing_agent
+
+@app.post("/pricing-chat/stream")
+async def pricing_chat_stream(request: ChatRequest):
+    """
+    Stream the AWS Pricing Agent's answer as plain text while it is generated.
+    
+    The first tokens arrive as soon as Bedrock produces them rather than after the
+    whole answer; a client disconnect stops the generation.
+    """
+    try:
+        agent = await _get_streaming_pricing_agent()
+    except Exception as e:
+        logger.error(f"AWS Pricing Agent unavailable for streaming: {str(e)}")
+        raise HTTPException(status_code=503, detail="AWS Pricing Agent not available.")
+    
+    logger.info(f"Streaming pricing request: {request.message[:100]}...")
+    # Follow-ups take context from the caller's own session, never from other users'
+    return StreamingResponse(agent.run_stream(request.message, request.user_id), media_type="text/plain; charset=utf-8")
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check(request: Request):
+    """
+    Health check endpoint for load balancer and monitoring.
+    
+    Returns service health status and orchestration information.
+    """
+    global orchestrator
+    
+    try:
+        health_response = HealthResponse.model_construct(
+            status="healthy",
+            timestamp=_iso_now()
+        )
+        
+        if orchestrator:
+            # Get orchestration status
+            orchestration_status = orchestrator.get_orchestration_status()
+            health_response.orchestration = orchestration_status
+            
+            # Check MCP status on the AWS Pricing Agent built at startup
+            pricing_agent = request.app.state.pricing_agent
+            if pricing_agent is not None:
+                health_response.mcp_status = {
+                    "aws_pricing_mcp_available": getattr(pricing_agent, 'pricing_mcp_client', None) is not None,
+                    "performance_stats": getattr(pricing_agent, 'performance_stats', {}),
+                    "connection_status": getattr(pricing_agent, 'mcp_connection_status', 'unknown')
+                }
+            else:
+                health_response.mcp_status = {
+                    "aws_pricing_mcp_available": False,
+                    "error": request.app.state.pricing_agent_error
+                }
+        else:
+            health_response.status = "degraded"
+            health_response.orchestration = {"error": "Orchestrator not initialized"}
+        
+        return health_response
+        
+    except Exception as e:
+        logger.error(f"Health check failed: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Health check failed: {str(e)}")
+
+@app.get("/status", response_model=Dict[str, Any])
+async def service_status(request: Request):
+    """
+    Detailed service status endpoint for monitoring and debugging.
+    """
+    global orchestrator
+    
+    try:
+        status = {
+            "service": "Strands Agents API",
+            "version": "1.0.0",
+            "timestamp": _iso_now(),
+            "environment": {
+                "aws_region": os.getenv("AWS_REGION", "us-east-1"),
+                "bedrock_model": os.getenv("BEDROCK_MODEL_ID", "amazon.nova-lite-v1:0"),
+                "python_version": sys.version,
+                "working_directory": os.getcwd()
+            }
+        }
+        
+        if orchestrator:
+            status["orchestration"] = orchestrator.get_orchestration_status()
+        else:
+            status["orchestration"] = {"status": "not_initialized"}
+        
+        # Check agent availability
+        pricing_agent = request.app.state.pricing_agent
+        if pricing_agent is not None:
+            status["agents"] = {
+                "aws_pricing_agent": {
+                    "available": True,
+                    "mcp_client_available": getattr(pricing_agent, 'pricing_mcp_client', None) is not None,
+                    "performance_stats": getattr(pricing_agent, 'performance_stats', {})
+                }
+            }
+        else:
+            status["agents"] = {
+                "aws_pricing_agent": {
+                    "available": False,
+                    "error": request.app.state.pricing_agent_error
+                }
+            }
+        
+        return status
+        
+    except Exception as e:
+        logger.error(f"Status check failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
+
+# Error handlers
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    """Global exception handler for unhandled errors."""
+    logger.error(f"Unhandled exception: {str(exc)}")
+    return JSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal server error",
+            "detail": str(exc),
+            "timestamp": _iso_now()
+        }
+    )
+
+# Main entry point
+if __name__ == "__main__":
+    import uvicorn
+    
+    # Configuration
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "8000"))
+    log_level = os.getenv("LOG_LEVEL", "info")
+    
+    logger.info(f"Starting server on {host}:{port}")
+    
+    # Run server (libuv-backed event loop when uvloop is installed)
+    uvicorn.run(
+        "api_server:app",
+        host=host,
+        port=port,
+        log_level=log_level,
+        loop="uvloop" if uvloop else "asyncio",
+        reload=False,  # Disable reload in production
+        access_log=True
     )
\ No newline at end of file
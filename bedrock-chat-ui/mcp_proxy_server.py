@@ -5,17 +5,24 @@ Allows containerized services to access MCP servers via REST API
 """
 
 import os
-import json
 import asyncio
+import time
 import logging
-import subprocess
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; uvicorn falls back to the asyncio loop
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -24,10 +31,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Worker threads for the loop's default executor
+EXECUTOR_MAX_WORKERS = int(os.getenv("EXECUTOR_MAX_WORKERS", "4"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-warm the MCP server session on startup and stop it on shutdown."""
+    # Small shared pool for the few blocking calls offloaded from the event loop
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="fastapi-blk")
+    )
+    # Warm up in the background so a slow uvx install doesn't hold back startup;
+    # early calls wait on the same start lock
+    prewarm = asyncio.create_task(_prewarm_mcp_session())
+    yield
+    prewarm.cancel()
+    await mcp_session.close()
+
+async def _prewarm_mcp_session():
+    """Start the MCP server session ahead of the first tool call."""
+    try:
+        await mcp_session.start()
+    except ConnectionError as e:
+        logger.warning(f"MCP server pre-warm failed, will retry on first call: {e}")
+
 app = FastAPI(
     title="MCP Proxy Server",
     description="HTTP proxy for MCP server access",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for all origins
@@ -39,6 +71,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling: set ENABLE_PROFILE=1, then add ?profile=1 to any request
+if os.getenv("ENABLE_PROFILE") == "1":
+    from pyinstrument import Profiler
+    from fastapi.responses import HTMLResponse
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        """Return a pyinstrument HTML report for the request instead of its response."""
+        if not request.query_params.get("profile"):
+            return await call_next(request)
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+# (epoch second, ISO string) pair reused until the clock ticks over
+_iso_cache = (0, "")
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO string at one-second resolution."""
+    global _iso_cache
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        # Naive like utcfromtimestamp() gave (deprecated in 3.12), so timestamps keep their format
+        _iso_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).replace(tzinfo=None).isoformat())
+    return _iso_cache[1]
+
 # Request/Response Models
 class MCPRequest(BaseModel):
     tool: str
@@ -53,82 +113,289 @@ class MCPResponse(BaseModel):
 # AWS Pricing Tools Mapping
 AWS_PRICING_TOOLS = {
     "get_pricing": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing"),
         "description": "Get AWS service pricing"
     },
     "get_pricing_service_codes": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_service_codes"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_service_codes"),
         "description": "Get available AWS service codes"
     },
     "get_pricing_service_attributes": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_service_attributes"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_service_attributes"),
         "description": "Get pricing attributes for a service"
     },
     "get_pricing_attribute_values": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_attribute_values"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "get_pricing_attribute_values"),
         "description": "Get valid values for pricing attributes"
     },
     "get_price_list_urls": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "get_price_list_urls"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "get_price_list_urls"),
         "description": "Get bulk pricing data URLs"
     },
     "generate_cost_report": {
-        "command": ["uvx", "awslabs.aws-pricing-mcp-server@latest", "generate_cost_report"],
+        "command": ("uvx", "awslabs.aws-pricing-mcp-server@latest", "generate_cost_report"),
         "description": "Generate cost analysis report"
     }
 }
 
-def execute_mcp_tool(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+# Persistent MCP server process shared by all tool calls
+MCP_SERVER_COMMAND = ("uvx", "awslabs.aws-pricing-mcp-server@latest")
+MCP_PROTOCOL_VERSION = "2024-11-05"
+MCP_STREAM_LIMIT = int(os.getenv("MCP_STREAM_LIMIT", str(16 * 1024 * 1024)))  # max bytes per JSON-RPC frame
+MCP_CALL_TIMEOUT = 30  # seconds per tool call, and the most a start-up handshake may take
+MCP_START_BACKOFF = float(os.getenv("MCP_START_BACKOFF", "30"))  # seconds before retrying a failed start
+
+# Environment for MCP server subprocesses, built once at import
+_MCP_ENV = {
+    **os.environ,
+    "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
+    "FASTMCP_LOG_LEVEL": "ERROR"
+}
+
+class MCPStdioSession:
     """
-    Execute an MCP tool via subprocess.
-    This is a simplified approach that works with the AWS pricing MCP server.
+    Long-lived MCP server subprocess speaking JSON-RPC over stdio.
+    Requests are multiplexed by id, so concurrent tool calls share one process
+    instead of paying interpreter and package start-up on every call.
     """
-    try:
-        if tool not in AWS_PRICING_TOOLS:
+    
+    def __init__(self, command: Tuple[str, ...]):
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._write_lock = asyncio.Lock()
+        self._start_lock = asyncio.Lock()
+        self._retry_at = float("-inf")  # monotonic time before which start() fails fast
+    
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+    
+    async def start(self):
+        """
+        Spawn the server and complete the MCP initialize handshake.
+        
+        After a failed start, further attempts fail fast for MCP_START_BACKOFF seconds,
+        so calls queued on the start lock fall back at once instead of each waiting
+        out another handshake.
+        """
+        async with self._start_lock:
+            if self.running:
+                return
+            if time.monotonic() < self._retry_at:
+                raise ConnectionError("MCP server failed to start recently; retrying after backoff")
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *self.command,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    env=_MCP_ENV,
+                    limit=MCP_STREAM_LIMIT
+                )
+                self._reader_task = asyncio.create_task(self._read_responses())
+                await self._request("initialize", {
+                    "protocolVersion": MCP_PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "mcp-proxy-server", "version": "1.0.0"}
+                }, timeout=MCP_CALL_TIMEOUT)
+                await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+            except Exception as e:
+                await self.close()
+                self._retry_at = time.monotonic() + MCP_START_BACKOFF
+                raise ConnectionError(f"Failed to start MCP server: {e}") from e
+            logger.info(f"MCP server session started (pid {self.process.pid})")
+    
+    async def close(self):
+        """Stop the server process and fail any in-flight calls."""
+        if self.running:
+            self.process.kill()
+            await self.process.wait()
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+    
+    async def call_tool(self, tool: str, params: Dict[str, Any], timeout: float = MCP_CALL_TIMEOUT) -> Dict[str, Any]:
+        """Invoke a tool on the running server, starting it first if needed."""
+        if not self.running:
+            await self.start()
+        
+        result = await self._request("tools/call", {"name": tool, "arguments": params}, timeout)
+        text = "".join(
+            item.get("text", "") for item in result.get("content", [])
+            if item.get("type") == "text"
+        )
+        if result.get("isError"):
             return {
                 "success": False,
-                "error": f"Unknown tool: {tool}"
+                "error": text or "Tool returned an error"
             }
         
-        # Build command with parameters
-        cmd = AWS_PRICING_TOOLS[tool]["command"].copy()
-        
-        # Add parameters as JSON input
-        input_data = json.dumps(params) if params else None
+        try:
+            # Try to parse as JSON
+            data = orjson.loads(text) if text else {}
+        except orjson.JSONDecodeError:
+            # Return raw output if not JSON
+            data = text
         
-        # Execute the command
-        result = subprocess.run(
-            cmd,
-            input=input_data,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env={
-                **os.environ,
-                "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
-                "FASTMCP_LOG_LEVEL": "ERROR"
+        return {
+            "success": True,
+            "data": data
+        }
+    
+    async def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+    
+    async def _send(self, message: Dict[str, Any]):
+        async with self._write_lock:
+            self.process.stdin.write(orjson.dumps(message) + b"\n")
+            await self.process.stdin.drain()
+    
+    async def _reply_to_server_request(self, message: Dict[str, Any]):
+        """Answer a request from the server: ping succeeds, anything else is unsupported."""
+        if message["method"] == "ping":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not found: {message['method']}"}
             }
-        )
+        await self._send(reply)
+    
+    async def _handle_message(self, message: Any):
+        """Resolve the pending request a response belongs to, or answer a server request."""
+        if not isinstance(message, dict):
+            return
+        if "method" in message:
+            # Notifications need no reply; server-initiated requests must get one
+            if "id" in message:
+                await self._reply_to_server_request(message)
+            return
         
-        if result.returncode == 0:
-            try:
-                # Try to parse as JSON
-                data = json.loads(result.stdout) if result.stdout else {}
-            except json.JSONDecodeError:
-                # Return raw output if not JSON
-                data = result.stdout
-            
-            return {
-                "success": True,
-                "data": data
-            }
+        future = self._pending.get(message.get("id"))
+        if future is None or future.done():
+            return
+        if "error" in message:
+            future.set_exception(RuntimeError(message["error"].get("message", "MCP request failed")))
         else:
+            future.set_result(message.get("result", {}))
+    
+    async def _read_responses(self):
+        """Resolve pending requests as responses arrive on stdout."""
+        try:
+            async for line in self.process.stdout:
+                try:
+                    await self._handle_message(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+                except Exception as e:
+                    # One malformed message must not stop the reader and fail every pending call
+                    logger.warning(f"Ignoring unexpected MCP server message {line[:200]!r}: {e!r}")
+        except ValueError as e:
+            # A frame larger than MCP_STREAM_LIMIT leaves the stream unusable
+            logger.error(f"MCP server response exceeded stream limit: {e}")
+        finally:
+            # Without a reader the process cannot answer, so stop it and let the next call respawn
+            if self.running:
+                self.process.kill()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("MCP server session closed"))
+
+mcp_session = MCPStdioSession(MCP_SERVER_COMMAND)
+
+# Successful tool results keyed by (tool, canonical params JSON)
+MCP_CACHE_TTL = float(os.getenv("MCP_CACHE_TTL", "300"))
+MCP_CACHE_MAX_ENTRIES = 256
+_tool_cache: Dict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]] = {}
+
+async def _run_tool_subprocess(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute an MCP tool in a one-shot subprocess.
+    Used when the persistent MCP server session is unavailable.
+    """
+    # Build command with parameters
+    cmd = AWS_PRICING_TOOLS[tool]["command"]
+    
+    # Add parameters as JSON input
+    input_data = orjson.dumps(params) if params else None
+    
+    # Execute the command
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_MCP_ENV
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(input_data), timeout=MCP_CALL_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    
+    if proc.returncode == 0:
+        try:
+            # Try to parse as JSON (orjson reads the raw bytes directly)
+            data = orjson.loads(stdout) if stdout else {}
+        except orjson.JSONDecodeError:
+            # Return raw output if not JSON
+            data = stdout.decode()
+        
+        return {
+            "success": True,
+            "data": data
+        }
+    else:
+        return {
+            "success": False,
+            "error": stderr.decode() or f"Command failed with code {proc.returncode}"
+        }
+
+async def execute_mcp_tool(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute an MCP tool.
+    Calls go through the persistent MCP server session and fall back to a
+    one-shot subprocess when the session cannot be started.
+    """
+    try:
+        if tool not in AWS_PRICING_TOOLS:
             return {
                 "success": False,
-                "error": result.stderr or f"Command failed with code {result.returncode}"
+                "error": f"Unknown tool: {tool}"
             }
+        
+        # Serve repeated queries from the cache while fresh
+        cache_key = (tool, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        cached = _tool_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < MCP_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            result = await mcp_session.call_tool(tool, params)
+        except ConnectionError as e:
+            logger.warning(f"MCP session unavailable, using one-shot subprocess: {e}")
+            result = await _run_tool_subprocess(tool, params)
+        
+        if result["success"]:
+            if len(_tool_cache) >= MCP_CACHE_MAX_ENTRIES:
+                _tool_cache.pop(next(iter(_tool_cache)))
+            _tool_cache[cache_key] = (time.monotonic(), result)
+        return result
             
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "success": False,
             "error": "Tool execution timed out"
@@ -158,13 +425,13 @@ async def call_aws_pricing_tool(tool: str, request: MCPRequest) -> MCPResponse:
     try:
         logger.info(f"Executing AWS pricing tool: {tool} with params: {request.params}")
         
-        result = execute_mcp_tool(tool, request.params)
+        result = await execute_mcp_tool(tool, request.params)
         
         return MCPResponse(
             success=result["success"],
             data=result.get("data"),
             error=result.get("error"),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_iso_now()
         )
         
     except Exception as e:
@@ -172,7 +439,7 @@ async def call_aws_pricing_tool(tool: str, request: MCPRequest) -> MCPResponse:
         return MCPResponse(
             success=False,
             error=str(e),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_iso_now()
         )
 
 @app.get("/mcp/aws-pricing/tools")
@@ -188,24 +455,37 @@ async def list_aws_pricing_tools():
         ]
     }
 
+# Last uvx availability probe, reused by /health for UVX_CHECK_TTL seconds
+UVX_CHECK_TTL = 60
+# -inf so the first /health probes even when monotonic() is still below the TTL after boot
+_uvx_state = {"checked_at": float("-inf"), "ok": False}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    # Test if uvx is available
-    try:
-        result = subprocess.run(
-            ["uvx", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        uvx_available = result.returncode == 0
-    except:
-        uvx_available = False
+    # Test if uvx is available (cached between probes)
+    if time.monotonic() - _uvx_state["checked_at"] >= UVX_CHECK_TTL:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "uvx", "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                _uvx_state["ok"] = await asyncio.wait_for(proc.wait(), timeout=2.0) == 0
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                _uvx_state["ok"] = False
+        except Exception:
+            _uvx_state["ok"] = False
+        _uvx_state["checked_at"] = time.monotonic()
+    uvx_available = _uvx_state["ok"]
     
     return {
         "status": "healthy",
         "uvx_available": uvx_available,
+        "mcp_session_running": mcp_session.running,
         "tools_count": len(AWS_PRICING_TOOLS)
     }
 
@@ -225,4 +505,9 @@ async def root():
 if __name__ == "__main__":
     port = int(os.getenv("MCP_PROXY_PORT", "8001"))
     logger.info(f"Starting MCP Proxy Server on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop" if uvloop else "asyncio"
+    )
\ No newline at end of file
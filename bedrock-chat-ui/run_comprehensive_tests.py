@@ -1,384 +1,600 @@
-#!/usr/bin/env python3
-"""
-Master Test Runner for Comprehensive AWS Pricing Agent Validation
-Task 11: Add comprehensive testing and validation
-
-This script runs all validation tests:
-1. Router Agent intent classification accuracy
-2. AI-generated cost estimates validation
-3. AI optimization recommendations testing
-4. Performance benchmarks for AI reasoning
-5. Requirements validation
-6. Error handling and fallback testing
-"""
-
-import sys
-import os
-import asyncio
-import json
-import time
-from typing import Dict, Any, List
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-class ComprehensiveTestRunner:
-    """
-    Master test runner for all AWS Pricing Agent validation tests.
-    """
-    
-    def __init__(self):
-        """Initialize the test runner."""
-        self.test_results = {}
-        self.start_time = time.time()
-    
-    async def run_all_tests(self) -> Dict[str, Any]:
-        """Run all comprehensive tests."""
-        print("🚀 AWS PRICING AGENT - COMPREHENSIVE TESTING SUITE")
-        print("Task 11: Focus on AI reasoning validation vs unit testing helper methods")
-        print("=" * 70)
-        print(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
-        
-        # Test 1: Comprehensive Validation Suite
-        print("1️⃣  Running Comprehensive Validation Suite...")
-        try:
-            from test_comprehensive_validation import ComprehensiveTestSuite
-            comprehensive_suite = ComprehensiveTestSuite()
-            self.test_results['comprehensive_validation'] = await comprehensive_suite.run_all_tests()
-            print("   ✅ Comprehensive validation completed")
-        except Exception as e:
-            print(f"   ❌ Comprehensive validation failed: {str(e)}")
-            self.test_results['comprehensive_validation'] = {'error': str(e)}
-        
-        print()
-        
-        # Test 2: Performance Monitoring
-        print("2️⃣  Running Performance Monitoring...")
-        try:
-            from test_performance_monitoring import PerformanceMonitor
-            performance_monitor = PerformanceMonitor()
-            self.test_results['performance_monitoring'] = await performance_monitor.run_performance_tests()
-            print("   ✅ Performance monitoring completed")
-        except Exception as e:
-            print(f"   ❌ Performance monitoring failed: {str(e)}")
-            self.test_results['performance_monitoring'] = {'error': str(e)}
-        
-        print()
-        
-        # Test 3: Cost Estimate Validation
-        print("3️⃣  Running Cost Estimate Validation...")
-        try:
-            from test_cost_validation import CostEstimateValidator
-            cost_validator = CostEstimateValidator()
-            self.test_results['cost_validation'] = await cost_validator.validate_all_benchmarks()
-            print("   ✅ Cost validation completed")
-        except Exception as e:
-            print(f"   ❌ Cost validation failed: {str(e)}")
-            self.test_results['cost_validation'] = {'error': str(e)}
-        
-        print()
-        
-        # Test 4: Router Agent Integration Test
-        print("4️⃣  Running Router Agent Integration Test...")
-        try:
-            await self._test_router_integration()
-            print("   ✅ Router integration test completed")
-        except Exception as e:
-            print(f"   ❌ Router integration test failed: {str(e)}")
-            self.test_results['router_integration'] = {'error': str(e)}
-        
-        print()
-        
-        # Generate master report
-        return self._generate_master_report()
-    
-    async def _test_router_integration(self):
-        """Test Router Agent integration with AWS Pricing Agent."""
-        try:
-            from agents.router_agent import RouterAgent
-            router = RouterAgent()
-            
-            # Test end-to-end routing
-            test_queries = [
-                "What's the cost of a t3.small EC2 instance?",
-                "How much does RDS MySQL cost?",
-                "Optimize costs for my AWS infrastructure"
-            ]
-            
-            router_results = []
-            
-            for query in test_queries:
-                try:
-                    result = await router.process_query(query)
-                    success = 'content' in result and len(result['content']) > 50
-                    router_results.append({
-                        'query': query,
-                        'success': success,
-                        'agent_type': result.get('agent_type', 'unknown'),
-                        'response_length': len(result.get('content', ''))
-                    })
-                except Exception as e:
-                    router_results.append({
-                        'query': query,
-                        'success': False,
-                        'error': str(e)
-                    })
-            
-            success_rate = sum(1 for r in router_results if r.get('success', False)) / len(router_results) * 100
-            
-            self.test_results['router_integration'] = {
-                'success_rate': success_rate,
-                'total_tests': len(router_results),
-                'successful_tests': sum(1 for r in router_results if r.get('success', False)),
-                'test_results': router_results
-            }
-            
-        except Exception as e:
-            self.test_results['router_integration'] = {'error': str(e)}
-    
-    def _generate_master_report(self) -> Dict[str, Any]:
-        """Generate comprehensive master report."""
-        total_time = time.time() - self.start_time
-        
-        print("📊 MASTER VALIDATION REPORT")
-        print("=" * 50)
-        print(f"Total execution time: {total_time:.1f} seconds")
-        print()
-        
-        # Analyze results from each test suite
-        test_summaries = {}
-        overall_success = True
-        
-        # Comprehensive Validation Results
-        comp_val = self.test_results.get('comprehensive_validation', {})
-        if 'error' not in comp_val:
-            comp_success_rate = comp_val.get('overall_success_rate', 0)
-            comp_readiness = comp_val.get('production_readiness_score', 0)
-            test_summaries['comprehensive_validation'] = {
-                'status': 'success' if comp_success_rate >= 80 else 'needs_improvement',
-                'success_rate': comp_success_rate,
-                'readiness_score': comp_readiness,
-                'key_metrics': {
-                    'intent_classification': self._extract_metric(comp_val, 'Router Intent Classification', 'accuracy_percentage'),
-                    'cost_estimates': self._extract_metric(comp_val, 'AI Cost Estimate Validation', 'feature_coverage'),
-                    'optimizations': self._extract_metric(comp_val, 'AI Optimization Recommendations', 'optimization_coverage'),
-                    'performance': self._extract_metric(comp_val, 'Performance Benchmarks', 'overall_performance_score'),
-                    'requirements': self._extract_metric(comp_val, 'Requirements Validation', 'requirements_coverage')
-                }
-            }
-            print(f"✅ Comprehensive Validation: {comp_success_rate:.1f}% success rate")
-            print(f"   Production Readiness: {comp_readiness:.1f}%")
-        else:
-            test_summaries['comprehensive_validation'] = {'status': 'error', 'error': comp_val['error']}
-            print(f"❌ Comprehensive Validation: {comp_val['error']}")
-            overall_success = False
-        
-        # Performance Monitoring Results
-        perf_mon = self.test_results.get('performance_monitoring', {})
-        if 'error' not in perf_mon:
-            perf_score = perf_mon.get('performance_score', 0)
-            perf_success_rate = perf_mon.get('overall_success_rate', 0)
-            test_summaries['performance_monitoring'] = {
-                'status': 'success' if perf_score >= 70 else 'needs_improvement',
-                'performance_score': perf_score,
-                'success_rate': perf_success_rate,
-                'avg_response_time': perf_mon.get('overall_stats', {}).get('avg_response_time', 0)
-            }
-            print(f"✅ Performance Monitoring: {perf_score:.1f}/100 score")
-            print(f"   Average Response Time: {perf_mon.get('overall_stats', {}).get('avg_response_time', 0):.2f}s")
-        else:
-            test_summaries['performance_monitoring'] = {'status': 'error', 'error': perf_mon['error']}
-            print(f"❌ Performance Monitoring: {perf_mon['error']}")
-            overall_success = False
-        
-        # Cost Validation Results
-        cost_val = self.test_results.get('cost_validation', {})
-        if 'error' not in cost_val:
-            cost_score = cost_val.get('overall_score', 0)
-            extraction_rate = cost_val.get('extraction_rate', 0)
-            accuracy_rate = cost_val.get('accuracy_rate', 0)
-            test_summaries['cost_validation'] = {
-                'status': 'success' if cost_score >= 70 else 'needs_improvement',
-                'overall_score': cost_score,
-                'extraction_rate': extraction_rate,
-                'accuracy_rate': accuracy_rate
-            }
-            print(f"✅ Cost Validation: {cost_score:.1f}/100 score")
-            print(f"   Extraction Rate: {extraction_rate:.1f}%, Accuracy Rate: {accuracy_rate:.1f}%")
-        else:
-            test_summaries['cost_validation'] = {'status': 'error', 'error': cost_val['error']}
-            print(f"❌ Cost Validation: {cost_val['error']}")
-            overall_success = False
-        
-        # Router Integration Results
-        router_int = self.test_results.get('router_integration', {})
-        if 'error' not in router_int:
-            router_success_rate = router_int.get('success_rate', 0)
-            test_summaries['router_integration'] = {
-                'status': 'success' if router_success_rate >= 80 else 'needs_improvement',
-                'success_rate': router_success_rate,
-                'total_tests': router_int.get('total_tests', 0)
-            }
-            print(f"✅ Router Integration: {router_success_rate:.1f}% success rate")
-        else:
-            test_summaries['router_integration'] = {'status': 'error', 'error': router_int['error']}
-            print(f"❌ Router Integration: {router_int['error']}")
-            overall_success = False
-        
-        print()
-        
-        # Overall Assessment
-        successful_test_suites = sum(1 for summary in test_summaries.values() if summary.get('status') == 'success')
-        total_test_suites = len(test_summaries)
-        overall_success_rate = successful_test_suites / total_test_suites * 100
-        
-        print(f"🎯 OVERALL ASSESSMENT")
-        print(f"   Test Suites Passed: {successful_test_suites}/{total_test_suites} ({overall_success_rate:.1f}%)")
-        
-        # Calculate composite scores
-        composite_scores = {}
-        
-        # Intent Classification Score
-        intent_score = test_summaries.get('comprehensive_validation', {}).get('key_metrics', {}).get('intent_classification', 0)
-        composite_scores['intent_classification'] = intent_score
-        
-        # Cost Accuracy Score
-        cost_accuracy = test_summaries.get('cost_validation', {}).get('accuracy_rate', 0)
-        composite_scores['cost_accuracy'] = cost_accuracy
-        
-        # Performance Score
-        performance_score = test_summaries.get('performance_monitoring', {}).get('performance_score', 0)
-        composite_scores['performance'] = performance_score
-        
-        # Overall AI Reasoning Score
-        ai_reasoning_score = (intent_score + cost_accuracy + performance_score) / 3 if all(composite_scores.values()) else 0
-        
-        print(f"\n📊 KEY METRICS:")
-        print(f"   Intent Classification: {intent_score:.1f}%")
-        print(f"   Cost Accuracy: {cost_accuracy:.1f}%")
-        print(f"   Performance Score: {performance_score:.1f}/100")
-        print(f"   AI Reasoning Score: {ai_reasoning_score:.1f}/100")
-        
-        # Production Readiness Assessment
-        readiness_criteria = [
-            ("Intent Classification", intent_score >= 80, "Router accurately identifies pricing queries"),
-            ("Cost Accuracy", cost_accuracy >= 70, "AI provides reasonably accurate cost estimates"),
-            ("Performance", performance_score >= 70, "Response times meet acceptable standards"),
-            ("Integration", router_int.get('success_rate', 0) >= 80, "Router-Agent integration works correctly"),
-            ("Error Handling", True, "Error handling implemented (tested in comprehensive suite)")
-        ]
-        
-        passed_criteria = sum(1 for _, passed, _ in readiness_criteria if passed)
-        total_criteria = len(readiness_criteria)
-        production_readiness = (passed_criteria / total_criteria) * 100
-        
-        print(f"\n🚀 PRODUCTION READINESS: {production_readiness:.1f}%")
-        
-        for criterion, passed, description in readiness_criteria:
-            status_icon = "✅" if passed else "❌"
-            print(f"   {status_icon} {criterion}: {description}")
-        
-        if production_readiness >= 90:
-            print(f"\n🎉 EXCELLENT - AWS Pricing Agent is ready for production!")
-            print("   All major validation criteria passed with high scores")
-        elif production_readiness >= 80:
-            print(f"\n✅ GOOD - AWS Pricing Agent meets production standards")
-            print("   Minor improvements possible but functional for deployment")
-        elif production_readiness >= 70:
-            print(f"\n⚠️  ACCEPTABLE - AWS Pricing Agent is functional")
-            print("   Some improvements recommended before production deployment")
-        else:
-            print(f"\n🔴 NEEDS IMPROVEMENT - Significant issues require attention")
-            print("   Address failing criteria before production deployment")
-        
-        # Recommendations
-        print(f"\n💡 RECOMMENDATIONS:")
-        
-        recommendations = []
-        
-        if intent_score < 80:
-            recommendations.append("Improve Router Agent intent classification with better training examples")
-        
-        if cost_accuracy < 70:
-            recommendations.append("Enhance cost estimation accuracy with updated benchmarks and better MCP integration")
-        
-        if performance_score < 70:
-            recommendations.append("Optimize system prompts and query processing for better response times")
-        
-        if router_int.get('success_rate', 0) < 80:
-            recommendations.append("Fix Router-Agent integration issues for reliable end-to-end functionality")
-        
-        if not recommendations:
-            recommendations.append("Continue monitoring performance and collect user feedback for improvements")
-            recommendations.append("Regular validation against AWS pricing changes")
-            recommendations.append("Consider adding more specialized agents to the router system")
-        
-        for i, rec in enumerate(recommendations, 1):
-            print(f"   {i}. {rec}")
-        
-        # Task 11 Completion Summary
-        print(f"\n📋 TASK 11 COMPLETION SUMMARY:")
-        print("   ✅ Router Agent intent classification accuracy tested")
-        print("   ✅ AI-generated cost estimates validated against benchmarks")
-        print("   ✅ AI optimization recommendations tested for practicality")
-        print("   ✅ Performance tests for AI reasoning response times completed")
-        print("   ✅ All requirements validation performed")
-        print("   ✅ Comprehensive testing focused on AI reasoning vs helper methods")
-        
-        return {
-            'overall_success_rate': overall_success_rate,
-            'production_readiness': production_readiness,
-            'ai_reasoning_score': ai_reasoning_score,
-            'composite_scores': composite_scores,
-            'test_summaries': test_summaries,
-            'execution_time': total_time,
-            'recommendations': recommendations,
-            'task_11_completed': True,
-            'detailed_results': self.test_results
-        }
-    
-    def _extract_metric(self, test_results: Dict[str, Any], test_name: str, metric_name: str) -> float:
-        """Extract a specific metric from test results."""
-        try:
-            test_results_list = test_results.get('test_results', [])
-            for result in test_results_list:
-                if result.get('test_name') == test_name:
-                    return result.get('details', {}).get(metric_name, 0)
-            return 0
-        except:
-            return 0
-
-async def main():
-    """Run the comprehensive test suite."""
-    print("🎯 AWS Pricing Agent - Master Test Runner")
-    print("Task 11: Comprehensive Testing and Validation")
-    print("=" * 60)
-    
-    runner = ComprehensiveTestRunner()
-    
-    try:
-        # Run all tests
-        master_report = await runner.run_all_tests()
-        
-        # Save master report
-        with open('master_test_report.json', 'w') as f:
-            json.dump(master_report, f, indent=2, default=str)
-        
-        print(f"\n✅ Master test execution complete!")
-        print(f"📄 Master report saved to: master_test_report.json")
-        print(f"📄 Individual reports saved to respective files")
-        
-        # Return success based on production readiness
-        return master_report.get('production_readiness', 0) >= 70
-        
-    except Exception as e:
-        print(f"❌ Master test execution failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-if __name__ == "__main__":
-    success = asyncio.run(main())
-    print(f"\n{'🎉 SUCCESS' if success else '❌ FAILURE'}: Task 11 comprehensive testing {'completed successfully' if success else 'needs attention'}")
-    sys.exit(0 if success else 1)
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Master Test Runner for Comprehensive AWS Pricing Agent Validation
+Task 11: Add comprehensive testing and validation
+
+This script runs all validation tests:
+1. Router Agent intent classification accuracy
+2. AI-generated cost estimates validation
+3. AI optimization recommendations testing
+4. Performance benchmarks for AI reasoning
+5. Requirements validation
+6. Error handling and fallback testing
+"""
+
+import sys
+import os
+import gzip
+import asyncio
+import argparse
+import json
+import time
+import statistics
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; reports fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+logger = logging.getLogger('comprehensive_tests')
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Import suites once up front; a missing module only fails its own suite
+_import_errors: Dict[str, Exception] = {}
+
+try:
+    from test_comprehensive_validation import ComprehensiveTestSuite
+except ImportError as e:
+    ComprehensiveTestSuite = None
+    _import_errors['comprehensive_validation'] = e
+
+try:
+    from test_performance_monitoring import PerformanceMonitor
+except ImportError as e:
+    PerformanceMonitor = None
+    _import_errors['performance_monitoring'] = e
+
+try:
+    from test_cost_validation import CostEstimateValidator
+except ImportError as e:
+    CostEstimateValidator = None
+    _import_errors['cost_validation'] = e
+
+try:
+    from agents.router_agent import RouterAgent
+except ImportError as e:
+    RouterAgent = None
+    _import_errors['router_integration'] = e
+
+# Per-suite wall-clock budgets (seconds) so one hung Bedrock call can't stall the run
+SUITE_TIMEOUTS = {
+    'comprehensive_validation': 900,
+    'performance_monitoring': 600,
+    'cost_validation': 600,
+    'router_integration': 180
+}
+
+# End-to-end routing checks for the router integration test
+ROUTER_TEST_QUERIES = (
+    "What's the cost of a t3.small EC2 instance?",
+    "How much does RDS MySQL cost?",
+    "Optimize costs for my AWS infrastructure"
+)
+
+def _summarize_comprehensive(data: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Optional[str]]:
+    """Summary fields and report lines for the comprehensive validation suite."""
+    success_rate = data.get('overall_success_rate', 0)
+    readiness = data.get('production_readiness_score', 0)
+    
+    # Index test details by name once (first match wins) instead of scanning per metric
+    details_by_name = {}
+    for result in data.get('test_results', []):
+        details_by_name.setdefault(result.get('test_name'), result.get('details') or {})
+    
+    fields = {
+        'success_rate': success_rate,
+        'readiness_score': readiness,
+        'key_metrics': {
+            'intent_classification': details_by_name.get('Router Intent Classification', {}).get('accuracy_percentage', 0),
+            'cost_estimates': details_by_name.get('AI Cost Estimate Validation', {}).get('feature_coverage', 0),
+            'optimizations': details_by_name.get('AI Optimization Recommendations', {}).get('optimization_coverage', 0),
+            'performance': details_by_name.get('Performance Benchmarks', {}).get('overall_performance_score', 0),
+            'requirements': details_by_name.get('Requirements Validation', {}).get('requirements_coverage', 0)
+        }
+    }
+    return fields, f"{success_rate:.1f}% success rate", f"Production Readiness: {readiness:.1f}%"
+
+def _summarize_performance(data: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Optional[str]]:
+    """Summary fields and report lines for the performance monitoring suite."""
+    score = data.get('performance_score', 0)
+    avg_response_time = data.get('overall_stats', {}).get('avg_response_time', 0)
+    fields = {
+        'performance_score': score,
+        'success_rate': data.get('overall_success_rate', 0),
+        'avg_response_time': avg_response_time
+    }
+    return fields, f"{score:.1f}/100 score", f"Average Response Time: {avg_response_time:.2f}s"
+
+def _summarize_cost(data: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Optional[str]]:
+    """Summary fields and report lines for the cost validation suite."""
+    score = data.get('overall_score', 0)
+    extraction_rate = data.get('extraction_rate', 0)
+    accuracy_rate = data.get('accuracy_rate', 0)
+    fields = {
+        'overall_score': score,
+        'extraction_rate': extraction_rate,
+        'accuracy_rate': accuracy_rate
+    }
+    return fields, f"{score:.1f}/100 score", f"Extraction Rate: {extraction_rate:.1f}%, Accuracy Rate: {accuracy_rate:.1f}%"
+
+def _summarize_router(data: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Optional[str]]:
+    """Summary fields and report lines for the router integration test."""
+    success_rate = data.get('success_rate', 0)
+    fields = {
+        'success_rate': success_rate,
+        'total_tests': data.get('total_tests', 0)
+    }
+    return fields, f"{success_rate:.1f}% success rate", None
+
+# (result key, report label, status score field, pass threshold, summarizer)
+REPORT_SPECS = (
+    ('comprehensive_validation', 'Comprehensive Validation', 'overall_success_rate', 80, _summarize_comprehensive),
+    ('performance_monitoring', 'Performance Monitoring', 'performance_score', 70, _summarize_performance),
+    ('cost_validation', 'Cost Validation', 'overall_score', 70, _summarize_cost),
+    ('router_integration', 'Router Integration', 'success_rate', 80, _summarize_router)
+)
+
+# Composite score fed by a suite's summary fields: result key -> (score name, extractor)
+COMPOSITE_SOURCES = {
+    'comprehensive_validation': ('intent_classification', lambda fields: fields['key_metrics']['intent_classification']),
+    'cost_validation': ('cost_accuracy', lambda fields: fields['accuracy_rate']),
+    'performance_monitoring': ('performance', lambda fields: fields['performance_score'])
+}
+
+# Production readiness criteria: (name, predicate over key scores, description)
+_READINESS_CRITERIA = (
+    ("Intent Classification", lambda s: s['intent'] >= 80, "Router accurately identifies pricing queries"),
+    ("Cost Accuracy", lambda s: s['cost'] >= 70, "AI provides reasonably accurate cost estimates"),
+    ("Performance", lambda s: s['perf'] >= 70, "Response times meet acceptable standards"),
+    ("Integration", lambda s: s['router'] >= 80, "Router-Agent integration works correctly"),
+    ("Error Handling", lambda s: True, "Error handling implemented (tested in comprehensive suite)")
+)
+
+# Recommendations triggered by low key scores: (predicate, recommendation)
+_REC_RULES = (
+    (lambda s: s['intent'] < 80, "Improve Router Agent intent classification with better training examples"),
+    (lambda s: s['cost'] < 70, "Enhance cost estimation accuracy with updated benchmarks and better MCP integration"),
+    (lambda s: s['perf'] < 70, "Optimize system prompts and query processing for better response times"),
+    (lambda s: s['router'] < 80, "Fix Router-Agent integration issues for reliable end-to-end functionality")
+)
+
+# Used when no rule fires
+DEFAULT_RECOMMENDATIONS = (
+    "Continue monitoring performance and collect user feedback for improvements",
+    "Regular validation against AWS pricing changes",
+    "Consider adding more specialized agents to the router system"
+)
+
+def _emit_suite_log(lines: List[str]):
+    """Write a suite's buffered output in one call so concurrent suites don't interleave."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+class ComprehensiveTestRunner:
+    """
+    Master test runner for all AWS Pricing Agent validation tests.
+    """
+    
+    def __init__(self):
+        """Initialize the test runner."""
+        self.test_results = {}
+        self.start_time = time.perf_counter()  # monotonic; only used for durations
+        
+        # Build each suite once; errors are raised when that suite runs
+        self._suites: Dict[str, Any] = {}
+        for key, suite_class in (
+            ('comprehensive_validation', ComprehensiveTestSuite),
+            ('performance_monitoring', PerformanceMonitor),
+            ('cost_validation', CostEstimateValidator)
+        ):
+            try:
+                if suite_class is None:
+                    raise _import_errors[key]
+                self._suites[key] = suite_class()
+            except Exception as e:
+                self._suites[key] = e
+        
+        # RouterAgent keeps per-conversation state, so each routing check gets its
+        # own router and the checks can run concurrently; all are built up front
+        try:
+            if RouterAgent is None:
+                raise _import_errors['router_integration']
+            self._suites['router_integration'] = [RouterAgent() for _ in ROUTER_TEST_QUERIES]
+        except Exception as e:
+            self._suites['router_integration'] = e
+    
+    def _get_suite(self, key: str) -> Any:
+        """Return the suite built in __init__, re-raising its construction error."""
+        suite = self._suites[key]
+        if isinstance(suite, Exception):
+            raise suite
+        return suite
+    
+    async def run_all_tests(self) -> Dict[str, Any]:
+        """Run all comprehensive tests."""
+        print("🚀 AWS PRICING AGENT - COMPREHENSIVE TESTING SUITE")
+        print("Task 11: Focus on AI reasoning validation vs unit testing helper methods")
+        print("=" * 70)
+        print(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print()
+        
+        # The four suites are independent, so overlap their network-bound work
+        async with asyncio.TaskGroup() as tg:
+            for key, suite in (
+                ('comprehensive_validation', self._run_comprehensive_validation()),
+                ('performance_monitoring', self._run_performance_monitoring()),
+                ('cost_validation', self._run_cost_validation()),
+                ('router_integration', self._run_router_integration())
+            ):
+                tg.create_task(self._run_with_timeout(key, suite))
+        
+        print()
+        
+        # Generate master report
+        return self._generate_master_report()
+    
+    async def _run_with_timeout(self, key: str, suite):
+        """Run one suite coroutine, recording an error if it exceeds its time budget."""
+        timeout = SUITE_TIMEOUTS[key]
+        try:
+            await asyncio.wait_for(suite, timeout)
+        except asyncio.TimeoutError:
+            self.test_results[key] = {'error': f'Timed out after {timeout}s'}
+            _emit_suite_log([f"   ❌ {key} timed out after {timeout}s"])
+    
+    async def _run_comprehensive_validation(self):
+        """Test 1: Comprehensive Validation Suite."""
+        log = ["1️⃣  Running Comprehensive Validation Suite..."]
+        try:
+            comprehensive_suite = self._get_suite('comprehensive_validation')
+            self.test_results['comprehensive_validation'] = await comprehensive_suite.run_all_tests()
+            log.append("   ✅ Comprehensive validation completed")
+        except Exception as e:
+            # Traceback only when DEBUG is enabled; %s keeps formatting lazy
+            logger.error("Comprehensive validation failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self.test_results['comprehensive_validation'] = {'error': str(e)}
+        _emit_suite_log(log)
+    
+    async def _run_performance_monitoring(self):
+        """Test 2: Performance Monitoring."""
+        log = ["2️⃣  Running Performance Monitoring..."]
+        try:
+            performance_monitor = self._get_suite('performance_monitoring')
+            self.test_results['performance_monitoring'] = await performance_monitor.run_performance_tests()
+            log.append("   ✅ Performance monitoring completed")
+        except Exception as e:
+            logger.error("Performance monitoring failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self.test_results['performance_monitoring'] = {'error': str(e)}
+        _emit_suite_log(log)
+    
+    async def _run_cost_validation(self):
+        """Test 3: Cost Estimate Validation."""
+        log = ["3️⃣  Running Cost Estimate Validation..."]
+        try:
+            cost_validator = self._get_suite('cost_validation')
+            self.test_results['cost_validation'] = await cost_validator.validate_all_benchmarks()
+            log.append("   ✅ Cost validation completed")
+        except Exception as e:
+            logger.error("Cost validation failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self.test_results['cost_validation'] = {'error': str(e)}
+        _emit_suite_log(log)
+    
+    async def _run_router_integration(self):
+        """Test 4: Router Agent Integration Test."""
+        log = ["4️⃣  Running Router Agent Integration Test..."]
+        try:
+            await self._test_router_integration()
+            log.append("   ✅ Router integration test completed")
+        except Exception as e:
+            logger.error("Router integration test failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self.test_results['router_integration'] = {'error': str(e)}
+        _emit_suite_log(log)
+    
+    async def _test_router_integration(self):
+        """Test Router Agent integration with AWS Pricing Agent."""
+        try:
+            routers = self._get_suite('router_integration')
+            
+            async def run_query(router, query: str) -> Dict[str, Any]:
+                try:
+                    result = await router.process_query(query)
+                    success = 'content' in result and len(result['content']) > 50
+                    return {
+                        'query': query,
+                        'success': success,
+                        'agent_type': result.get('agent_type', 'unknown'),
+                        'response_length': len(result.get('content', ''))
+                    }
+                except Exception as e:
+                    return {
+                        'query': query,
+                        'success': False,
+                        'error': str(e)
+                    }
+            
+            # Each query has its own router, so they are issued concurrently
+            router_results = await asyncio.gather(
+                *(run_query(router, query) for router, query in zip(routers, ROUTER_TEST_QUERIES))
+            )
+            
+            successful = sum(1 for r in router_results if r.get('success', False))
+            success_rate = successful / len(router_results) * 100 if router_results else 0
+            
+            self.test_results['router_integration'] = {
+                'success_rate': success_rate,
+                'total_tests': len(router_results),
+                'successful_tests': successful,
+                'test_results': router_results
+            }
+            
+        except Exception as e:
+            self.test_results['router_integration'] = {'error': str(e)}
+    
+    def _generate_master_report(self) -> Dict[str, Any]:
+        """Generate comprehensive master report."""
+        total_time = time.perf_counter() - self.start_time
+        
+        print("📊 MASTER VALIDATION REPORT")
+        print("=" * 50)
+        print(f"Total execution time: {total_time:.1f} seconds")
+        print()
+        
+        # Analyze results from each test suite
+        test_summaries = {}
+        overall_success = True
+        
+        # Composite scores are filled in as their source suites are summarized; None means no data
+        composite_scores = dict.fromkeys(('intent_classification', 'cost_accuracy', 'performance'))
+        
+        for key, label, score_field, threshold, summarize in REPORT_SPECS:
+            data = self.test_results.get(key, {})
+            if 'error' in data:
+                test_summaries[key] = {'status': 'error', 'error': data['error']}
+                print(f"❌ {label}: {data['error']}")
+                overall_success = False
+                continue
+            
+            fields, headline, details = summarize(data)
+            test_summaries[key] = {
+                'status': 'success' if data.get(score_field, 0) >= threshold else 'needs_improvement',
+                **fields
+            }
+            print(f"✅ {label}: {headline}")
+            if details:
+                print(f"   {details}")
+            
+            if key in COMPOSITE_SOURCES:
+                name, extract = COMPOSITE_SOURCES[key]
+                composite_scores[name] = extract(fields)
+        
+        router_int = self.test_results.get('router_integration', {})
+        
+        print()
+        
+        # Overall Assessment
+        statuses = [summary.get('status') for summary in test_summaries.values()]
+        successful_test_suites = statuses.count('success')
+        total_test_suites = len(test_summaries)
+        overall_success_rate = successful_test_suites / total_test_suites * 100
+        
+        print(f"🎯 OVERALL ASSESSMENT")
+        print(f"   Test Suites Passed: {successful_test_suites}/{total_test_suites} ({overall_success_rate:.1f}%)")
+        
+        intent_score = composite_scores['intent_classification'] or 0
+        cost_accuracy = composite_scores['cost_accuracy'] or 0
+        performance_score = composite_scores['performance'] or 0
+        
+        # Overall AI Reasoning Score: mean of the scores we have, so a real 0 still counts
+        valid_scores = [score for score in composite_scores.values() if score is not None]
+        ai_reasoning_score = sum(valid_scores) / len(valid_scores) if valid_scores else 0
+        
+        print(f"\n📊 KEY METRICS:")
+        print(f"   Intent Classification: {intent_score:.1f}%")
+        print(f"   Cost Accuracy: {cost_accuracy:.1f}%")
+        print(f"   Performance Score: {performance_score:.1f}/100")
+        print(f"   AI Reasoning Score: {ai_reasoning_score:.1f}/100")
+        
+        # Production Readiness Assessment
+        scores = {
+            'intent': intent_score,
+            'cost': cost_accuracy,
+            'perf': performance_score,
+            'router': router_int.get('success_rate', 0)
+        }
+        readiness_criteria = [(name, check(scores), description) for name, check, description in _READINESS_CRITERIA]
+        
+        passed_criteria = sum(1 for _, passed, _ in readiness_criteria if passed)
+        total_criteria = len(readiness_criteria)
+        production_readiness = (passed_criteria / total_criteria) * 100
+        
+        print(f"\n🚀 PRODUCTION READINESS: {production_readiness:.1f}%")
+        
+        for criterion, passed, description in readiness_criteria:
+            status_icon = "✅" if passed else "❌"
+            print(f"   {status_icon} {criterion}: {description}")
+        
+        if production_readiness >= 90:
+            print(f"\n🎉 EXCELLENT - AWS Pricing Agent is ready for production!")
+            print("   All major validation criteria passed with high scores")
+        elif production_readiness >= 80:
+            print(f"\n✅ GOOD - AWS Pricing Agent meets production standards")
+            print("   Minor improvements possible but functional for deployment")
+        elif production_readiness >= 70:
+            print(f"\n⚠️  ACCEPTABLE - AWS Pricing Agent is functional")
+            print("   Some improvements recommended before production deployment")
+        else:
+            print(f"\n🔴 NEEDS IMPROVEMENT - Significant issues require attention")
+            print("   Address failing criteria before production deployment")
+        
+        # Recommendations
+        print(f"\n💡 RECOMMENDATIONS:")
+        
+        recommendations = [rec for check, rec in _REC_RULES if check(scores)] or list(DEFAULT_RECOMMENDATIONS)
+        
+        for i, rec in enumerate(recommendations, 1):
+            print(f"   {i}. {rec}")
+        
+        # Task 11 Completion Summary
+        print(f"\n📋 TASK 11 COMPLETION SUMMARY:")
+        print("   ✅ Router Agent intent classification accuracy tested")
+        print("   ✅ AI-generated cost estimates validated against benchmarks")
+        print("   ✅ AI optimization recommendations tested for practicality")
+        print("   ✅ Performance tests for AI reasoning response times completed")
+        print("   ✅ All requirements validation performed")
+        print("   ✅ Comprehensive testing focused on AI reasoning vs helper methods")
+        
+        return {
+            'overall_success_rate': overall_success_rate,
+            'production_readiness': production_readiness,
+            'ai_reasoning_score': ai_reasoning_score,
+            'composite_scores': composite_scores,
+            'test_summaries': test_summaries,
+            'execution_time': total_time,
+            'recommendations': recommendations,
+            'task_11_completed': True
+        }
+
+DETAILED_REPORT_PATH = 'master_test_report.detailed.json.gz'
+
+# Committed JSON-lines history for regression gating; starts empty, passing runs on main append to it
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench', 'baseline.jsonl')
+BASELINE_WINDOW = 5
+# Wall time swings with Bedrock and MCP latency, so it gets a wider margin; suites are
+# capped at SUITE_TIMEOUTS, so it must stay well under doubling to ever trigger
+REGRESSION_TOLERANCE = {
+    'ai_reasoning_score': 0.2,
+    'execution_time': 0.5
+}
+BASELINE_METRICS = tuple(REGRESSION_TOLERANCE)
+
+def _write_json_report(path: str, report: Dict[str, Any], indent: bool = True):
+    """Write a report as JSON (gzipped for .gz paths), using orjson when it is installed."""
+    opener = gzip.open if path.endswith('.gz') else open
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with opener(path, 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=option))
+    else:
+        with opener(path, 'wt') as f:
+            json.dump(report, f, indent=2 if indent else None, default=str)
+
+def _read_baseline(path: str = BASELINE_PATH) -> List[Dict[str, Any]]:
+    """Read the baseline history, oldest run first; a missing file is an empty history."""
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+def _compare_baseline(report: Dict[str, Any], path: str = BASELINE_PATH) -> Tuple[bool, List[Tuple[str, float, float]]]:
+    """
+    Compare a master report against the median of the last BASELINE_WINDOW recorded runs.
+    
+    Returns:
+        (passed, regressions) where each regression is (metric, baseline median, current).
+        An empty history always passes.
+    """
+    history = _read_baseline(path)[-BASELINE_WINDOW:]
+    
+    regressions = []
+    for metric, tolerance in REGRESSION_TOLERANCE.items():
+        current = report.get(metric)
+        values = [run[metric] for run in history if run.get(metric) is not None]
+        if current is None or not values:
+            continue
+        previous = statistics.median(values)
+        # Time regresses upwards, scores regress downwards
+        if metric == 'execution_time':
+            regressed = current > previous * (1 + tolerance)
+        else:
+            regressed = current < previous * (1 - tolerance)
+        if regressed:
+            regressions.append((metric, previous, current))
+    
+    return not regressions, regressions
+
+def _update_baseline(report: Dict[str, Any], path: str = BASELINE_PATH):
+    """Append the tracked metrics of this run to the baseline history."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    entry.update((metric, report.get(metric)) for metric in BASELINE_METRICS)
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+async def main(verbose: bool = False, update_baseline: bool = False) -> int:
+    """
+    Run the comprehensive test suite.
+    
+    Args:
+        verbose: Inline every suite's detailed results into the master report
+        update_baseline: Append this run to the baseline history even off main
+    
+    Returns:
+        Exit code: 0 on success, 1 if readiness is below target, 2 on a baseline regression
+    """
+    print("🎯 AWS Pricing Agent - Master Test Runner")
+    print("Task 11: Comprehensive Testing and Validation")
+    print("=" * 60)
+    
+    runner = ComprehensiveTestRunner()
+    
+    try:
+        # Run all tests
+        master_report = await runner.run_all_tests()
+        
+        # Save the summary report, with the full per-suite trace kept separately
+        if verbose:
+            master_report['detailed_results'] = runner.test_results
+        _write_json_report('master_test_report.json', master_report)
+        _write_json_report(DETAILED_REPORT_PATH, runner.test_results, indent=False)
+        
+        print(f"\n✅ Master test execution complete!")
+        print(f"📄 Master report saved to: master_test_report.json")
+        print(f"📄 Detailed results saved to: {DETAILED_REPORT_PATH}")
+        print(f"📄 Individual reports saved to respective files")
+        
+        passed, regressions = _compare_baseline(master_report)
+        if not passed:
+            print(f"\n📉 REGRESSION vs median of last {BASELINE_WINDOW} runs in {BASELINE_PATH}:")
+            for metric, previous, current in regressions:
+                print(f"   {metric}: {previous:.1f} -> {current:.1f}")
+            return 2
+        
+        # Return success based on production readiness
+        if master_report.get('production_readiness', 0) < 70:
+            return 1
+        
+        # Only passing runs join the history, so failures don't drag the median down
+        if update_baseline or os.getenv('GITHUB_REF') == 'refs/heads/main':
+            _update_baseline(master_report)
+            print(f"📄 Run appended to baseline: {BASELINE_PATH}")
+        return 0
+        
+    except Exception as e:
+        logger.exception("Master test execution failed: %s", e)
+        return 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all AWS Pricing Agent validation suites")
+    parser.add_argument('--verbose', action='store_true', help='Inline detailed suite results into master_test_report.json')
+    parser.add_argument('--update-baseline', action='store_true', help='Append this run to bench/baseline.jsonl if it passes')
+    parser.add_argument('--log-level', default=os.getenv('LOG_LEVEL', 'INFO'), help='Logging level; DEBUG adds suite failure tracebacks')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=args.log_level.upper(), format='%(levelname)s %(name)s: %(message)s')
+    
+    # Run on uvloop when available; the suites are dominated by network I/O
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as loop_runner:
+        exit_code = loop_runner.run(main(verbose=args.verbose, update_baseline=args.update_baseline))
+    success = exit_code == 0
+    print(f"\n{'🎉 SUCCESS' if success else '❌ FAILURE'}: Task 11 comprehensive testing {'completed successfully' if success else 'needs attention'}")
+    sys.exit(exit_code)
\ No newline at end of file
@@ -1,329 +1,402 @@
-#!/usr/bin/env python3
-"""
-Agent Management CLI Tool
-
-Command-line interface for managing specialized agents, creating new agents,
-and monitoring agent performance.
-"""
-
-import argparse
-import json
-import sys
-import asyncio
-from typing import Dict, Any
-from .agent_registry import get_agent_registry
-from .agent_factory import get_agent_factory
-
-def list_agents():
-    """List all registered agents."""
-    registry = get_agent_registry()
-    agents = registry.get_available_agents()
-    
-    if not agents:
-        print("No agents registered.")
-        return
-    
-    print("Registered Agents:")
-    print("-" * 50)
-    
-    for agent_id, metadata in agents.items():
-        status = "✓ Enabled" if metadata.enabled else "✗ Disabled"
-        print(f"ID: {agent_id}")
-        print(f"Name: {metadata.name}")
-        print(f"Description: {metadata.description}")
-        print(f"Version: {metadata.version}")
-        print(f"Status: {status}")
-        print(f"Capabilities: {len(metadata.capabilities)}")
-        
-        if metadata.capabilities:
-            for cap in metadata.capabilities:
-                print(f"  - {cap.name}: {cap.description}")
-        
-        print("-" * 50)
-
-def agent_status():
-    """Show detailed agent status."""
-    registry = get_agent_registry()
-    status = registry.get_agent_status()
-    
-    print("Agent Status Report:")
-    print("=" * 60)
-    
-    for agent_id, agent_status in status.items():
-        print(f"\nAgent: {agent_id}")
-        print(f"Name: {agent_status['name']}")
-        print(f"Description: {agent_status['description']}")
-        print(f"Version: {agent_status['version']}")
-        print(f"Enabled: {'Yes' if agent_status['enabled'] else 'No'}")
-        print(f"Instance Loaded: {'Yes' if agent_status['instance_loaded'] else 'No'}")
-        print(f"Instantiable: {'Yes' if agent_status.get('instantiable', False) else 'No'}")
-        print(f"Capabilities: {agent_status['capabilities']}")
-        
-        if 'error' in agent_status:
-            print(f"Error: {agent_status['error']}")
-
-def test_agent(agent_id: str, query: str):
-    """Test an agent with a query."""
-    async def run_test():
-        registry = get_agent_registry()
-        agent = registry.get_agent(agent_id)
-        
-        if not agent:
-            print(f"Agent '{agent_id}' not found.")
-            return
-        
-        print(f"Testing agent '{agent_id}' with query: {query}")
-        print("-" * 50)
-        
-        try:
-            response = await agent.process_query(query)
-            
-            print(f"Status: {response.get('status', 'unknown')}")
-            print(f"Agent Type: {response.get('agent_type', 'unknown')}")
-            print(f"MCP Available: {response.get('mcp_available', False)}")
-            print(f"Confidence: {response.get('confidence', 'unknown')}")
-            print(f"Cached: {response.get('cached', False)}")
-            print("\nResponse:")
-            print(response.get('response', 'No response content'))
-            
-            if 'error' in response:
-                print(f"\nError: {response['error']}")
-                if 'troubleshooting' in response:
-                    print("Troubleshooting:")
-                    for tip in response['troubleshooting']:
-                        print(f"  - {tip}")
-        
-        except Exception as e:
-            print(f"Error testing agent: {e}")
-    
-    asyncio.run(run_test())
-
-def create_agent_interactive():
-    """Interactive agent creation."""
-    print("Interactive Agent Creation")
-    print("=" * 30)
-    
-    agent_id = input("Agent ID (e.g., 'my_agent'): ").strip()
-    if not agent_id:
-        print("Agent ID is required.")
-        return
-    
-    name = input("Agent Name (e.g., 'My Specialized Agent'): ").strip()
-    if not name:
-        print("Agent name is required.")
-        return
-    
-    description = input("Description: ").strip()
-    if not description:
-        print("Description is required.")
-        return
-    
-    print("\nDomain Knowledge (enter multiple lines, end with empty line):")
-    domain_knowledge_lines = []
-    while True:
-        line = input()
-        if not line:
-            break
-        domain_knowledge_lines.append(line)
-    
-    domain_knowledge = "\n".join(domain_knowledge_lines)
-    
-    # Collect capabilities
-    capabilities = []
-    print("\nCapabilities (enter at least one):")
-    
-    while True:
-        cap_name = input("Capability name (or press Enter to finish): ").strip()
-        if not cap_name:
-            break
-        
-        cap_desc = input("Capability description: ").strip()
-        keywords = input("Keywords (comma-separated): ").strip().split(',')
-        keywords = [k.strip() for k in keywords if k.strip()]
-        
-        phrases = input("Phrases (comma-separated): ").strip().split(',')
-        phrases = [p.strip() for p in phrases if p.strip()]
-        
-        priority = input("Priority (1-10, default 5): ").strip()
-        try:
-            priority = int(priority) if priority else 5
-        except ValueError:
-            priority = 5
-        
-        confidence = input("Confidence threshold (0.0-1.0, default 0.5): ").strip()
-        try:
-            confidence = float(confidence) if confidence else 0.5
-        except ValueError:
-            confidence = 0.5
-        
-        capabilities.append({
-            'name': cap_name,
-            'description': cap_desc,
-            'keywords': keywords,
-            'phrases': phrases,
-            'priority': priority,
-            'confidence_threshold': confidence
-        })
-    
-    if not capabilities:
-        print("At least one capability is required.")
-        return
-    
-    mcp_server = input("MCP server command (optional): ").strip()
-    mcp_server = mcp_server if mcp_server else None
-    
-    # Create the agent
-    factory = get_agent_factory()
-    agent = factory.create_agent_from_template(
-        agent_id=agent_id,
-        name=name,
-        description=description,
-        domain_knowledge=domain_knowledge,
-        capabilities=capabilities,
-        mcp_server=mcp_server
-    )
-    
-    if agent:
-        print(f"\n✓ Successfully created and registered agent '{agent_id}'")
-        print(f"Name: {name}")
-        print(f"Capabilities: {len(capabilities)}")
-    else:
-        print(f"\n✗ Failed to create agent '{agent_id}'")
-
-def create_predefined_agent(agent_type: str):
-    """Create a predefined agent."""
-    factory = get_agent_factory()
-    
-    if agent_type == 'security':
-        agent = factory.create_security_agent()
-        if agent:
-            print("✓ Successfully created AWS Security Agent")
-        else:
-            print("✗ Failed to create AWS Security Agent")
-    
-    elif agent_type == 'performance':
-        agent = factory.create_performance_agent()
-        if agent:
-            print("✓ Successfully created AWS Performance Agent")
-        else:
-            print("✗ Failed to create AWS Performance Agent")
-    
-    else:
-        print(f"Unknown predefined agent type: {agent_type}")
-        print("Available types: security, performance")
-
-def enable_agent(agent_id: str):
-    """Enable an agent."""
-    registry = get_agent_registry()
-    registry.enable_agent(agent_id)
-    print(f"✓ Enabled agent '{agent_id}'")
-
-def disable_agent(agent_id: str):
-    """Disable an agent."""
-    registry = get_agent_registry()
-    registry.disable_agent(agent_id)
-    print(f"✓ Disabled agent '{agent_id}'")
-
-def export_config(filepath: str):
-    """Export agent configuration."""
-    registry = get_agent_registry()
-    registry.export_configuration(filepath)
-    print(f"✓ Exported configuration to {filepath}")
-
-def find_agent_for_query(query: str):
-    """Find the best agent for a query."""
-    registry = get_agent_registry()
-    best_agent_id = registry.find_best_agent(query)
-    
-    if best_agent_id:
-        metadata = registry.agent_metadata.get(best_agent_id)
-        agent = registry.get_agent(best_agent_id)
-        confidence = agent.get_confidence_score(query) if agent else 0.0
-        
-        print(f"Best agent for query: '{query}'")
-        print(f"Agent ID: {best_agent_id}")
-        print(f"Name: {metadata.name if metadata else 'Unknown'}")
-        print(f"Confidence Score: {confidence:.2f}")
-        
-        if metadata:
-            print(f"Capabilities: {[cap.name for cap in metadata.capabilities]}")
-    else:
-        print(f"No suitable agent found for query: '{query}'")
-
-def main():
-    """Main CLI function."""
-    parser = argparse.ArgumentParser(description="Agent Management CLI")
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # List agents
-    subparsers.add_parser('list', help='List all registered agents')
-    
-    # Agent status
-    subparsers.add_parser('status', help='Show detailed agent status')
-    
-    # Test agent
-    test_parser = subparsers.add_parser('test', help='Test an agent with a query')
-    test_parser.add_argument('agent_id', help='Agent ID to test')
-    test_parser.add_argument('query', help='Query to test with')
-    
-    # Create agent
-    create_parser = subparsers.add_parser('create', help='Create a new agent')
-    create_subparsers = create_parser.add_subparsers(dest='create_type', help='Creation methods')
-    
-    create_subparsers.add_parser('interactive', help='Interactive agent creation')
-    
-    predefined_parser = create_subparsers.add_parser('predefined', help='Create predefined agent')
-    predefined_parser.add_argument('type', choices=['security', 'performance'], help='Predefined agent type')
-    
-    # Enable/disable agents
-    enable_parser = subparsers.add_parser('enable', help='Enable an agent')
-    enable_parser.add_argument('agent_id', help='Agent ID to enable')
-    
-    disable_parser = subparsers.add_parser('disable', help='Disable an agent')
-    disable_parser.add_argument('agent_id', help='Agent ID to disable')
-    
-    # Export configuration
-    export_parser = subparsers.add_parser('export', help='Export agent configuration')
-    export_parser.add_argument('filepath', help='File path to export to')
-    
-    # Find agent for query
-    find_parser = subparsers.add_parser('find', help='Find best agent for a query')
-    find_parser.add_argument('query', help='Query to find agent for')
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    try:
-        if args.command == 'list':
-            list_agents()
-        elif args.command == 'status':
-            agent_status()
-        elif args.command == 'test':
-            test_agent(args.agent_id, args.query)
-        elif args.command == 'create':
-            if args.create_type == 'interactive':
-                create_agent_interactive()
-            elif args.create_type == 'predefined':
-                create_predefined_agent(args.type)
-            else:
-                print("Please specify creation type: interactive or predefined")
-        elif args.command == 'enable':
-            enable_agent(args.agent_id)
-        elif args.command == 'disable':
-            disable_agent(args.agent_id)
-        elif args.command == 'export':
-            export_config(args.filepath)
-        elif args.command == 'find':
-            find_agent_for_query(args.query)
-    
-    except KeyboardInterrupt:
-        print("\nOperation cancelled.")
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-
-if __name__ == '__main__':
+#!/usr/bin/env python3
+"""
+Agent Management CLI Tool
+
+Command-line interface for managing specialized agents, creating new agents,
+and monitoring agent performance.
+"""
+
+import re
+import sys
+import logging
+
+# Registry/factory imports live inside each handler: they pull in the whole
+# agent stack, which --help and unknown commands never need.
+
+# Agents rendered per stdout write in listing commands
+OUTPUT_CHUNK_AGENTS = 64
+
+def _write_lines(lines: list):
+    """Write buffered output lines with a single stdout call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def list_agents():
+    """List all registered agents."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    agents = registry.get_available_agents()
+    
+    if not agents:
+        print("No agents registered.")
+        return
+    
+    lines = ["Registered Agents:", "-" * 50]
+    
+    for i, (agent_id, metadata) in enumerate(agents.items(), 1):
+        status = "✓ Enabled" if metadata.enabled else "✗ Disabled"
+        lines += [
+            f"ID: {agent_id}",
+            f"Name: {metadata.name}",
+            f"Description: {metadata.description}",
+            f"Version: {metadata.version}",
+            f"Status: {status}",
+            f"Capabilities: {len(metadata.capabilities)}"
+        ]
+        lines += [f"  - {cap.name}: {cap.description}" for cap in metadata.capabilities]
+        lines.append("-" * 50)
+        
+        if i % OUTPUT_CHUNK_AGENTS == 0:
+            _write_lines(lines)
+            lines = []
+    
+    if lines:
+        _write_lines(lines)
+
+def agent_status():
+    """Show detailed agent status."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    status = registry.get_agent_status()
+    
+    lines = ["Agent Status Report:", "=" * 60]
+    
+    for i, (agent_id, agent_status) in enumerate(status.items(), 1):
+        lines += [
+            f"\nAgent: {agent_id}",
+            f"Name: {agent_status['name']}",
+            f"Description: {agent_status['description']}",
+            f"Version: {agent_status['version']}",
+            f"Enabled: {'Yes' if agent_status['enabled'] else 'No'}",
+            f"Instance Loaded: {'Yes' if agent_status['instance_loaded'] else 'No'}",
+            f"Instantiable: {'Yes' if agent_status.get('instantiable', False) else 'No'}",
+            f"Capabilities: {agent_status['capabilities']}"
+        ]
+        
+        if 'error' in agent_status:
+            lines.append(f"Error: {agent_status['error']}")
+        
+        if i % OUTPUT_CHUNK_AGENTS == 0:
+            _write_lines(lines)
+            lines = []
+    
+    if lines:
+        _write_lines(lines)
+
+async def _run_agent_test(agent_id: str, agent, query: str) -> list:
+    """Run one agent test and return its report lines."""
+    if not agent:
+        return [f"Agent '{agent_id}' not found."]
+    
+    lines = [f"Testing agent '{agent_id}' with query: {query}", "-" * 50]
+    
+    try:
+        response = await agent.process_query(query)
+        
+        lines += [
+            f"Status: {response.get('status', 'unknown')}",
+            f"Agent Type: {response.get('agent_type', 'unknown')}",
+            f"MCP Available: {response.get('mcp_available', False)}",
+            f"Confidence: {response.get('confidence', 'unknown')}",
+            f"Cached: {response.get('cached', False)}",
+            "\nResponse:",
+            str(response.get('response', 'No response content'))
+        ]
+        
+        if 'error' in response:
+            lines.append(f"\nError: {response['error']}")
+            if 'troubleshooting' in response:
+                lines.append("Troubleshooting:")
+                lines += [f"  - {tip}" for tip in response['troubleshooting']]
+    
+    except Exception as e:
+        lines.append(f"Error testing agent: {e}")
+    
+    return lines
+
+def test_agent(agent_id: str, query: str):
+    """Test an agent with a query."""
+    import asyncio
+    from .agent_registry import get_agent_registry
+    
+    registry = get_agent_registry()
+    _write_lines(asyncio.run(_run_agent_test(agent_id, registry.get_agent(agent_id), query)))
+
+def test_agents_batch(*args: str):
+    """Test several agent/query pairs concurrently on a single event loop."""
+    import asyncio
+    from .agent_registry import get_agent_registry
+    
+    tests = list(zip(args[::2], args[1::2]))
+    
+    # Resolve each agent once, before any test starts
+    registry = get_agent_registry()
+    agents = {agent_id: registry.get_agent(agent_id) for agent_id, _ in tests}
+    
+    async def run_all():
+        return await asyncio.gather(
+            *(_run_agent_test(agent_id, agents[agent_id], query) for agent_id, query in tests)
+        )
+    
+    loop = asyncio.new_event_loop()
+    try:
+        reports = loop.run_until_complete(run_all())
+    finally:
+        loop.close()
+    
+    for report in reports:
+        _write_lines(report + [""])
+
+# Comma separator with any surrounding whitespace
+_CSV_SEPARATOR = re.compile(r'\s*,\s*')
+
+def _split_csv(raw: str) -> list:
+    """Split a comma-separated answer into its non-empty, trimmed items."""
+    raw = raw.strip()
+    return [item for item in _CSV_SEPARATOR.split(raw) if item] if raw else []
+
+def _line_reader():
+    """
+    Return an input()-like reader for the creation prompts.
+    
+    Piped stdin (e.g. ``create interactive < spec.txt``) is read in one go and
+    served line by line; exhausted input reads as empty lines.
+    """
+    if sys.stdin.isatty():
+        return input
+    
+    lines = iter(sys.stdin.read().splitlines())
+    return lambda prompt='': next(lines, '')
+
+def create_agent_interactive():
+    """Interactive agent creation."""
+    print("Interactive Agent Creation")
+    print("=" * 30)
+    
+    read = _line_reader()
+    
+    agent_id = read("Agent ID (e.g., 'my_agent'): ").strip()
+    if not agent_id:
+        print("Agent ID is required.")
+        return
+    
+    name = read("Agent Name (e.g., 'My Specialized Agent'): ").strip()
+    if not name:
+        print("Agent name is required.")
+        return
+    
+    description = read("Description: ").strip()
+    if not description:
+        print("Description is required.")
+        return
+    
+    print("\nDomain Knowledge (enter multiple lines, end with empty line):")
+    domain_knowledge_lines = []
+    while True:
+        line = read()
+        if not line:
+            break
+        domain_knowledge_lines.append(line)
+    
+    domain_knowledge = "\n".join(domain_knowledge_lines)
+    
+    # Collect capabilities
+    capabilities = []
+    print("\nCapabilities (enter at least one):")
+    
+    while True:
+        cap_name = read("Capability name (or press Enter to finish): ").strip()
+        if not cap_name:
+            break
+        
+        cap_desc = read("Capability description: ").strip()
+        keywords = _split_csv(read("Keywords (comma-separated): "))
+        phrases = _split_csv(read("Phrases (comma-separated): "))
+        
+        priority = read("Priority (1-10, default 5): ").strip()
+        try:
+            priority = int(priority) if priority else 5
+        except ValueError:
+            priority = 5
+        
+        confidence = read("Confidence threshold (0.0-1.0, default 0.5): ").strip()
+        try:
+            confidence = float(confidence) if confidence else 0.5
+        except ValueError:
+            confidence = 0.5
+        
+        capabilities.append({
+            'name': cap_name,
+            'description': cap_desc,
+            'keywords': keywords,
+            'phrases': phrases,
+            'priority': priority,
+            'confidence_threshold': confidence
+        })
+    
+    if not capabilities:
+        print("At least one capability is required.")
+        return
+    
+    mcp_server = read("MCP server command (optional): ").strip()
+    mcp_server = mcp_server if mcp_server else None
+    
+    # Create the agent
+    from .agent_factory import get_agent_factory
+    factory = get_agent_factory()
+    agent = factory.create_agent_from_template(
+        agent_id=agent_id,
+        name=name,
+        description=description,
+        domain_knowledge=domain_knowledge,
+        capabilities=capabilities,
+        mcp_server=mcp_server
+    )
+    
+    if agent:
+        print(f"\n✓ Successfully created and registered agent '{agent_id}'")
+        print(f"Name: {name}")
+        print(f"Capabilities: {len(capabilities)}")
+    else:
+        print(f"\n✗ Failed to create agent '{agent_id}'")
+
+def create_predefined_agent(*agent_types: str):
+    """Create one or more predefined agents, registering them together."""
+    from .agent_factory import get_agent_factory, PREDEFINED_AGENT_SPECS
+    
+    unknown = [agent_type for agent_type in agent_types if agent_type not in PREDEFINED_AGENT_SPECS]
+    if unknown:
+        print(f"Unknown predefined agent type: {', '.join(unknown)}")
+        print(f"Available types: {', '.join(PREDEFINED_AGENT_SPECS)}")
+        return
+    
+    factory = get_agent_factory()
+    agents = factory.create_agents_batch([PREDEFINED_AGENT_SPECS[agent_type] for agent_type in agent_types])
+    
+    for agent_type in agent_types:
+        spec = PREDEFINED_AGENT_SPECS[agent_type]
+        if agents.get(spec['agent_id']):
+            print(f"✓ Successfully created {spec['name']}")
+        else:
+            print(f"✗ Failed to create {spec['name']}")
+
+def enable_agent(agent_id: str):
+    """Enable an agent."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    registry.enable_agent(agent_id)
+    print(f"✓ Enabled agent '{agent_id}'")
+
+def disable_agent(agent_id: str):
+    """Disable an agent."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    registry.disable_agent(agent_id)
+    print(f"✓ Disabled agent '{agent_id}'")
+
+def export_config(filepath: str):
+    """Export agent configuration."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    registry.export_configuration(filepath)
+    print(f"✓ Exported configuration to {filepath}")
+
+def find_agent_for_query(query: str):
+    """Find the best agent for a query."""
+    from .agent_registry import get_agent_registry
+    registry = get_agent_registry()
+    best_agent_id, confidence = registry.find_best_agent_with_score(query)
+    
+    if best_agent_id:
+        metadata = registry.agent_metadata.get(best_agent_id)
+        
+        print(f"Best agent for query: '{query}'")
+        print(f"Agent ID: {best_agent_id}")
+        print(f"Name: {metadata.name if metadata else 'Unknown'}")
+        print(f"Confidence Score: {confidence:.2f}")
+        
+        if metadata:
+            print(f"Capabilities: {[cap.name for cap in metadata.capabilities]}")
+    else:
+        print(f"No suitable agent found for query: '{query}'")
+
+USAGE = """usage: agent_cli <command> [args]
+
+Agent Management CLI
+
+commands:
+  list                        List all registered agents
+  status                      Show detailed agent status
+  test AGENT_ID QUERY         Test an agent with a query
+  test-batch AGENT_ID QUERY [AGENT_ID QUERY]...
+                              Test several agent/query pairs concurrently
+  create interactive          Interactive agent creation
+  create predefined TYPE...   Create predefined agents (security, performance)
+  enable AGENT_ID             Enable an agent
+  disable AGENT_ID            Disable an agent
+  export FILEPATH             Export agent configuration
+  find QUERY                  Find best agent for a query"""
+
+# Arity for commands taking one or more AGENT_ID QUERY pairs
+PAIRS = 'pairs'
+
+# Command name -> (handler, positional arg count, None for one or more, or PAIRS), or a nested table for subcommands
+COMMANDS = {
+    'list': (list_agents, 0),
+    'status': (agent_status, 0),
+    'test': (test_agent, 2),
+    'test-batch': (test_agents_batch, PAIRS),
+    'create': {
+        'interactive': (create_agent_interactive, 0),
+        'predefined': (create_predefined_agent, None)
+    },
+    'enable': (enable_agent, 1),
+    'disable': (disable_agent, 1),
+    'export': (export_config, 1),
+    'find': (find_agent_for_query, 1)
+}
+
+def _dispatch(table: dict, args: list) -> bool:
+    """Run the handler matching args; returns False for an unknown command or wrong arg count."""
+    if not args or args[0] not in table:
+        return False
+    
+    entry, params = table[args[0]], args[1:]
+    if isinstance(entry, dict):
+        return _dispatch(entry, params)
+    
+    handler, arity = entry
+    if arity is None:
+        arity_ok = len(params) >= 1
+    elif arity is PAIRS:
+        arity_ok = len(params) >= 2 and len(params) % 2 == 0
+    else:
+        arity_ok = len(params) == arity
+    if not arity_ok:
+        return False
+    handler(*params)
+    return True
+
+def main():
+    """Main CLI function."""
+    args = sys.argv[1:]
+    
+    if not args or args[0] in ('-h', '--help'):
+        print(USAGE)
+        return
+    
+    # The agent modules only create loggers; the CLI, as the application, configures output
+    logging.basicConfig(level=logging.INFO)
+    
+    try:
+        if not _dispatch(COMMANDS, args):
+            print(USAGE, file=sys.stderr)
+            sys.exit(2)
+    
+    except KeyboardInterrupt:
+        print("\nOperation cancelled.")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,341 +1,731 @@
-#!/usr/bin/env python3
-"""
-Agent Registry System for Extensible Specialized Agents
-
-This module provides a centralized registry for managing specialized agents,
-enabling easy addition of new agents without modifying the router core.
-"""
-
-import json
-import logging
-from typing import Dict, Any, Optional, List, Type, Callable
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AgentCapability:
-    """Defines a capability that an agent can handle."""
-    name: str
-    description: str
-    keywords: List[str]
-    phrases: List[str]
-    priority: int = 1  # Higher priority agents are preferred for overlapping capabilities
-    confidence_threshold: float = 0.5  # Minimum confidence to route to this agent
-
-@dataclass
-class AgentMetadata:
-    """Metadata for a registered agent."""
-    name: str
-    description: str
-    version: str
-    author: str
-    capabilities: List[AgentCapability]
-    model_config: Dict[str, Any]
-    system_prompt_template: str
-    tools_required: List[str] = None
-    mcp_servers: List[str] = None
-    dependencies: List[str] = None
-    enabled: bool = True
-
-class BaseSpecializedAgent(ABC):
-    """Base class for all specialized agents."""
-    
-    @abstractmethod
-    def __init__(self, config: Dict[str, Any] = None):
-        """Initialize the agent with optional configuration."""
-        pass
-    
-    @abstractmethod
-    async def process_query(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Process a query and return structured response."""
-        pass
-    
-    @abstractmethod
-    def get_capabilities(self) -> List[AgentCapability]:
-        """Return list of capabilities this agent can handle."""
-        pass
-    
-    @abstractmethod
-    def get_metadata(self) -> AgentMetadata:
-        """Return agent metadata."""
-        pass
-    
-    def validate_query(self, query: str) -> bool:
-        """Validate if this agent can handle the query."""
-        return True
-    
-    def get_confidence_score(self, query: str) -> float:
-        """Calculate confidence score for handling this query."""
-        capabilities = self.get_capabilities()
-        query_lower = query.lower()
-        
-        max_score = 0.0
-        for capability in capabilities:
-            score = 0.0
-            
-            # Enhanced keyword matching with diminishing returns
-            keyword_matches = sum(1 for keyword in capability.keywords if keyword in query_lower)
-            if capability.keywords and keyword_matches > 0:
-                # Use logarithmic scaling for multiple matches to prevent oversaturation
-                # 1 match = 0.6, 2 matches = 0.75, 3+ matches = 0.85+
-                keyword_ratio = min(keyword_matches / len(capability.keywords), 1.0)
-                keyword_score = 0.4 + (keyword_ratio * 0.4)  # Base 0.4 + up to 0.4 more
-                score += keyword_score
-            
-            # Enhanced phrase matching with higher weight
-            phrase_matches = sum(1 for phrase in capability.phrases if phrase in query_lower)
-            if capability.phrases and phrase_matches > 0:
-                # Phrases are more specific, give them higher weight
-                phrase_score = min(phrase_matches * 0.5, 0.9)  # Up to 0.9 for phrases
-                score += phrase_score
-            
-            # Bonus for high-priority capabilities
-            if score > 0:
-                priority_bonus = (capability.priority - 5) * 0.05  # Small bonus for priority 6+
-                score += max(priority_bonus, 0)
-                
-                # Apply priority weighting
-                score *= (capability.priority / 10.0)
-                
-                # Enhanced minimum score for any relevant match
-                if keyword_matches > 0 or phrase_matches > 0:
-                    score = max(score, 0.6)  # Higher minimum for AWS pricing agent
-            
-            max_score = max(max_score, score)
-        
-        return min(max_score, 1.0)
-
-class AgentRegistry:
-    """Central registry for managing specialized agents."""
-    
-    def __init__(self):
-        """Initialize the agent registry."""
-        self.agents: Dict[str, Type[BaseSpecializedAgent]] = {}
-        self.agent_metadata: Dict[str, AgentMetadata] = {}
-        self.agent_instances: Dict[str, BaseSpecializedAgent] = {}
-        self.configuration: Dict[str, Any] = {}
-        
-        # Load configuration
-        self._load_configuration()
-        
-        # Register built-in agents
-        self._register_builtin_agents()
-    
-    def _load_configuration(self):
-        """Load agent registry configuration."""
-        try:
-            with open('src/agents/agent_config.json', 'r') as f:
-                self.configuration = json.load(f)
-        except FileNotFoundError:
-            logger.info("No agent configuration file found, using defaults")
-            self.configuration = {
-                "default_model": {
-                    "model_id": "amazon.nova-lite-v1:0",
-                    "temperature": 0.3,
-                    "max_tokens": 4000,
-                    "top_p": 0.8
-                },
-                "agent_settings": {
-                    "max_conversation_history": 10,
-                    "enable_caching": True,
-                    "cache_size": 10,
-                    "timeout_seconds": 30
-                }
-            }
-    
-    def _register_builtin_agents(self):
-        """Register built-in agents."""
-        # Register AWS Pricing Agent
-        try:
-            from .aws_pricing_agent import AWSPricingAgent
-            self.register_agent_class("aws_pricing", AWSPricingAgent)
-            logger.info("Registered built-in AWS Pricing Agent")
-        except ImportError as e:
-            logger.warning(f"Could not register AWS Pricing Agent: {e}")
-    
-    def register_agent_class(self, agent_id: str, agent_class: Type[BaseSpecializedAgent]):
-        """Register a new agent class."""
-        if not issubclass(agent_class, BaseSpecializedAgent):
-            raise ValueError(f"Agent class must inherit from BaseSpecializedAgent")
-        
-        self.agents[agent_id] = agent_class
-        
-        # Create temporary instance to get metadata
-        try:
-            temp_instance = agent_class()
-            metadata = temp_instance.get_metadata()
-            self.agent_metadata[agent_id] = metadata
-            logger.info(f"Registered agent: {agent_id} - {metadata.description}")
-        except Exception as e:
-            logger.error(f"Failed to get metadata for agent {agent_id}: {e}")
-    
-    def register_agent_instance(self, agent_id: str, agent_instance: BaseSpecializedAgent):
-        """Register a pre-configured agent instance."""
-        if not isinstance(agent_instance, BaseSpecializedAgent):
-            raise ValueError(f"Agent must inherit from BaseSpecializedAgent")
-        
-        self.agent_instances[agent_id] = agent_instance
-        metadata = agent_instance.get_metadata()
-        self.agent_metadata[agent_id] = metadata
-        logger.info(f"Registered agent instance: {agent_id} - {metadata.description}")
-    
-    def get_agent(self, agent_id: str) -> Optional[BaseSpecializedAgent]:
-        """Get an agent instance by ID."""
-        # Check if we have a pre-configured instance
-        if agent_id in self.agent_instances:
-            return self.agent_instances[agent_id]
-        
-        # Create new instance from class
-        if agent_id in self.agents:
-            try:
-                agent_config = self.configuration.get("agent_settings", {})
-                agent_instance = self.agents[agent_id](agent_config)
-                self.agent_instances[agent_id] = agent_instance
-                return agent_instance
-            except Exception as e:
-                logger.error(f"Failed to create agent instance {agent_id}: {e}")
-                return None
-        
-        return None
-    
-    def find_best_agent(self, query: str, exclude_agents: List[str] = None) -> Optional[str]:
-        """Find the best agent to handle a query based on capabilities and confidence."""
-        exclude_agents = exclude_agents or []
-        best_agent = None
-        best_score = 0.0
-        
-        for agent_id, metadata in self.agent_metadata.items():
-            if agent_id in exclude_agents or not metadata.enabled:
-                continue
-            
-            agent = self.get_agent(agent_id)
-            if not agent:
-                continue
-            
-            try:
-                confidence = agent.get_confidence_score(query)
-                
-                # Check if confidence meets threshold
-                min_confidence = min(cap.confidence_threshold for cap in metadata.capabilities)
-                if confidence < min_confidence:
-                    continue
-                
-                # Weight by priority
-                max_priority = max(cap.priority for cap in metadata.capabilities)
-                weighted_score = confidence * (max_priority / 10.0)
-                
-                if weighted_score > best_score:
-                    best_score = weighted_score
-                    best_agent = agent_id
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating agent {agent_id}: {e}")
-                continue
-        
-        if best_agent:
-            logger.info(f"Selected agent {best_agent} with confidence {best_score:.2f}")
-        
-        return best_agent
-    
-    def get_available_agents(self) -> Dict[str, AgentMetadata]:
-        """Get all available agents and their metadata."""
-        return {aid: meta for aid, meta in self.agent_metadata.items() if meta.enabled}
-    
-    def get_agent_capabilities(self, agent_id: str) -> List[AgentCapability]:
-        """Get capabilities for a specific agent."""
-        if agent_id in self.agent_metadata:
-            return self.agent_metadata[agent_id].capabilities
-        return []
-    
-    def enable_agent(self, agent_id: str):
-        """Enable an agent."""
-        if agent_id in self.agent_metadata:
-            self.agent_metadata[agent_id].enabled = True
-            logger.info(f"Enabled agent: {agent_id}")
-    
-    def disable_agent(self, agent_id: str):
-        """Disable an agent."""
-        if agent_id in self.agent_metadata:
-            self.agent_metadata[agent_id].enabled = False
-            logger.info(f"Disabled agent: {agent_id}")
-    
-    def get_agent_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all registered agents."""
-        status = {}
-        
-        for agent_id, metadata in self.agent_metadata.items():
-            agent_status = {
-                "name": metadata.name,
-                "description": metadata.description,
-                "version": metadata.version,
-                "enabled": metadata.enabled,
-                "capabilities": len(metadata.capabilities),
-                "instance_loaded": agent_id in self.agent_instances
-            }
-            
-            # Check if agent can be instantiated
-            if agent_id in self.agents and agent_id not in self.agent_instances:
-                try:
-                    test_instance = self.agents[agent_id]({})
-                    agent_status["instantiable"] = True
-                except Exception as e:
-                    agent_status["instantiable"] = False
-                    agent_status["error"] = str(e)
-            else:
-                agent_status["instantiable"] = True
-            
-            status[agent_id] = agent_status
-        
-        return status
-    
-    def reload_configuration(self):
-        """Reload agent configuration from file."""
-        self._load_configuration()
-        logger.info("Reloaded agent registry configuration")
-    
-    def export_configuration(self, filepath: str):
-        """Export current configuration to file."""
-        config = {
-            "agents": {},
-            "configuration": self.configuration
-        }
-        
-        for agent_id, metadata in self.agent_metadata.items():
-            config["agents"][agent_id] = {
-                "name": metadata.name,
-                "description": metadata.description,
-                "version": metadata.version,
-                "author": metadata.author,
-                "enabled": metadata.enabled,
-                "capabilities": [
-                    {
-                        "name": cap.name,
-                        "description": cap.description,
-                        "keywords": cap.keywords,
-                        "phrases": cap.phrases,
-                        "priority": cap.priority,
-                        "confidence_threshold": cap.confidence_threshold
-                    }
-                    for cap in metadata.capabilities
-                ],
-                "model_config": metadata.model_config,
-                "tools_required": metadata.tools_required,
-                "mcp_servers": metadata.mcp_servers,
-                "dependencies": metadata.dependencies
-            }
-        
-        with open(filepath, 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        logger.info(f"Exported agent configuration to {filepath}")
-
-# Global registry instance
-agent_registry = AgentRegistry()
-
-def get_agent_registry() -> AgentRegistry:
-    """Get the global agent registry instance."""
-    return agent_registry
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Agent Registry System for Extensible Specialized Agents
+
+This module provides a centralized registry for managing specialized agents,
+enabling easy addition of new agents without modifying the router core.
+"""
+
+import os
+import re
+import sys
+import json
+import logging
+from typing import Dict, Any, Optional, List, Tuple, Type, Callable, FrozenSet, Set, Iterable
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from abc import ABC, abstractmethod
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; matching falls back to substring scans
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser and encoder
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented JSON bytes with sorted keys, so exports diff cleanly."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode()
+
+logger = logging.getLogger(__name__)
+
+# A query word, for capabilities that match keywords as whole words
+_WORD = re.compile(r'\w+')
+
+def _query_words(query_lower: str) -> FrozenSet[str]:
+    """The distinct words of an already-lowercased query."""
+    return frozenset(_WORD.findall(query_lower))
+
+@dataclass(slots=True, frozen=True)
+class AgentCapability:
+    """Defines a capability that an agent can handle."""
+    name: str
+    description: str
+    keywords: Tuple[str, ...]  # Lists are accepted and stored as tuples
+    phrases: Tuple[str, ...]
+    priority: int = 1  # Higher priority agents are preferred for overlapping capabilities
+    confidence_threshold: float = 0.5  # Minimum confidence to route to this agent
+    whole_words: bool = False  # Match single-word keywords as whole query words, not substrings
+    # keywords split by how each is matched: by query word or by substring. Terms
+    # are kept as written (duplicates count twice, mixed case never matches the
+    # lowercased query), the same as scanning keywords directly
+    _keyword_tokens: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _substring_keywords: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so derived and coerced fields go through object.__setattr__
+        object.__setattr__(self, 'keywords', tuple(self.keywords))
+        object.__setattr__(self, 'phrases', tuple(self.phrases))
+        # Interned so the vocabulary shared across agents (e.g. 'security') is stored once
+        keywords = tuple(sys.intern(keyword) for keyword in self.keywords)
+        keyword_tokens = tuple(
+            keyword for keyword in keywords if _WORD.fullmatch(keyword)
+        ) if self.whole_words else ()
+        object.__setattr__(self, '_keyword_tokens', keyword_tokens)
+        object.__setattr__(self, '_substring_keywords', tuple(
+            keyword for keyword in keywords if keyword not in keyword_tokens
+        ))
+
+@dataclass(slots=True, frozen=True)
+class AgentMetadata:
+    """Metadata for a registered agent; change fields with dataclasses.replace."""
+    name: str
+    description: str
+    version: str
+    author: str
+    capabilities: Tuple[AgentCapability, ...]  # Lists are accepted and stored as tuples
+    model_config: Dict[str, Any]
+    system_prompt_template: str
+    tools_required: Optional[Tuple[str, ...]] = None
+    mcp_servers: Optional[Tuple[str, ...]] = None
+    dependencies: Optional[Tuple[str, ...]] = None
+    enabled: bool = True
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'capabilities', tuple(self.capabilities))
+        for name in ('tools_required', 'mcp_servers', 'dependencies'):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, tuple(value))
+
+# Distinct queries whose per-agent confidences are kept between routing calls
+CONFIDENCE_CACHE_SIZE = 1024
+
+# Without pyahocorasick, term sets at least this large are matched by walking a
+# trie from each query position; smaller sets are cheaper to substring-test in C
+TRIE_MIN_TERMS = 256
+
+class TermMatcher:
+    """
+    Finds which of a fixed set of terms occur in an already-lowercased query.
+    
+    With pyahocorasick the terms are compiled into one automaton and a query is
+    matched in a single pass. Otherwise large term sets go into a character
+    trie walked from every query position, and small ones are substring-tested
+    term by term. All three report substring occurrences, the same semantics as
+    scanning each capability's terms directly.
+    
+    A compiled regex alternation isn't used: finditer can't report terms that
+    overlap or share a start position (e.g. 'cost' and 'cost of'), and with a
+    lookahead to allow that it runs about 5x slower than the substring scan.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        terms = set(terms)
+        
+        # An empty term matches every query; the automaton can't hold it
+        self._always = {''} & terms
+        terms.discard('')
+        self._terms = tuple(terms)
+        
+        self._automaton = None
+        self._trie = None
+        if ahocorasick is not None and terms:
+            self._automaton = ahocorasick.Automaton()
+            for term in terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        elif len(terms) >= TRIE_MIN_TERMS:
+            # Nested dicts keyed by character; '' marks the end of a term
+            self._trie = {}
+            for term in terms:
+                node = self._trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node[''] = term
+    
+    def _walk_trie(self, query_lower: str) -> Set[str]:
+        """Collect every term that starts at some position of the query."""
+        matched = set()
+        for start in range(len(query_lower)):
+            node = self._trie
+            for char in query_lower[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                if '' in node:
+                    matched.add(node[''])
+        return matched
+    
+    def matched_terms(self, query_lower: str) -> Set[str]:
+        """Return the terms occurring in an already-lowercased query."""
+        if self._automaton is not None:
+            matched = {term for _, term in self._automaton.iter(query_lower)}
+        elif self._trie is not None:
+            matched = self._walk_trie(query_lower)
+        else:
+            matched = {term for term in self._terms if term in query_lower}
+        return matched | self._always if self._always else matched
+
+def _capability_score(capability: AgentCapability, keyword_matches: int, phrase_matches: int) -> float:
+    """Score one capability from its keyword/phrase hit counts (uncapped)."""
+    if not keyword_matches and not phrase_matches:
+        return 0.0
+    
+    score = 0.0
+    if keyword_matches:
+        # Base 0.4 plus up to 0.4 more for the share of keywords matched
+        score = 0.4 + min(keyword_matches / len(capability.keywords), 1.0) * 0.4
+    if phrase_matches:
+        # Phrases are more specific, so each weighs more (up to 0.9)
+        score += min(phrase_matches * 0.5, 0.9)
+    
+    # Bonus for priority 6+, then priority weighting, floored at 0.6 for any relevant match
+    priority = capability.priority
+    return max((score + max((priority - 5) * 0.05, 0)) * (priority / 10.0), 0.6)
+
+def score_capabilities(capabilities: List[AgentCapability], query_lower: str) -> float:
+    """
+    Confidence (0-1) that a set of capabilities can handle an already-lowercased query.
+    
+    Terms are substring-tested, except keywords of whole_words capabilities,
+    which are looked up in the query's words.
+    Scoring stops at the first capability reaching the 1.0 clamp, so lists
+    ordered by descending priority finish soonest.
+    """
+    max_score = 0.0
+    query_words = None
+    for capability in capabilities:
+        keyword_matches = 0
+        phrase_matches = 0
+        if capability._keyword_tokens:
+            if query_words is None:
+                query_words = _query_words(query_lower)
+            for keyword in capability._keyword_tokens:
+                if keyword in query_words:
+                    keyword_matches += 1
+        
+        for keyword in capability._substring_keywords:
+            if keyword in query_lower:
+                keyword_matches += 1
+        for phrase in capability.phrases:
+            if phrase in query_lower:
+                phrase_matches += 1
+        
+        if not keyword_matches and not phrase_matches:
+            continue
+        score = _capability_score(capability, keyword_matches, phrase_matches)
+        if score > max_score:
+            max_score = score
+            if max_score >= 1.0:
+                break
+    
+    return min(max_score, 1.0)
+
+class BaseSpecializedAgent(ABC):
+    """Base class for all specialized agents."""
+    
+    # No instance state here, so subclasses that declare __slots__ get no __dict__
+    __slots__ = ()
+    
+    @abstractmethod
+    def __init__(self, config: Dict[str, Any] = None):
+        """Initialize the agent with optional configuration."""
+        pass
+    
+    @abstractmethod
+    async def process_query(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Process a query and return structured response."""
+        pass
+    
+    @abstractmethod
+    def get_capabilities(self) -> List[AgentCapability]:
+        """Return list of capabilities this agent can handle."""
+        pass
+    
+    @abstractmethod
+    def get_metadata(self) -> AgentMetadata:
+        """Return agent metadata."""
+        pass
+    
+    @classmethod
+    def get_default_metadata(cls) -> AgentMetadata:
+        """
+        Return metadata for registering the agent class.
+        
+        Constructs a throwaway instance by default; agents whose metadata doesn't
+        depend on configuration should override this to skip their setup.
+        """
+        return cls().get_metadata()
+    
+    def validate_query(self, query: str) -> bool:
+        """Validate if this agent can handle the query."""
+        return True
+    
+    def close(self):
+        """Release resources the agent holds open, such as MCP sessions; a no-op by default."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def get_confidence_score(self, query: str) -> float:
+        """Calculate confidence score for handling this query."""
+        return score_capabilities(self.get_capabilities(), query.lower())
+
+# Registry configuration file, shipped alongside this module (found even when imported top-level)
+CONFIG_PATH = Path(__file__).with_name('agent_config.json')
+
+_FALLBACK_CONFIGURATION = {
+    "default_model": {
+        "model_id": "amazon.nova-lite-v1:0",
+        "temperature": 0.3,
+        "max_tokens": 4000,
+        "top_p": 0.8
+    },
+    "agent_settings": {
+        "max_conversation_history": 10,
+        "enable_caching": True,
+        "cache_size": 10,
+        "timeout_seconds": 30
+    }
+}
+
+def _read_configuration() -> Tuple[Optional[int], Dict[str, Any]]:
+    """
+    Parse the registry configuration file.
+    
+    Returns (mtime_ns, config), or (None, defaults) if it's missing. A file that
+    isn't valid JSON also yields the defaults, with its mtime so it is only
+    re-read once it changes.
+    """
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        return mtime, _json_loads(CONFIG_PATH.read_bytes())
+    except FileNotFoundError:
+        logger.info("No agent configuration file found, using defaults")
+        return None, _FALLBACK_CONFIGURATION
+    except ValueError as e:  # json and orjson decode errors both subclass ValueError
+        logger.warning("Invalid agent configuration file %s, using defaults: %s", CONFIG_PATH, e)
+        return mtime, _FALLBACK_CONFIGURATION
+
+# Parsed once at import; each registry starts from a shallow copy
+_DEFAULT_CONFIG_MTIME, _DEFAULT_CONFIG = _read_configuration()
+
+class AgentRegistry:
+    """Central registry for managing specialized agents."""
+    
+    def __init__(self):
+        """Initialize the agent registry."""
+        self.agents: Dict[str, Type[BaseSpecializedAgent]] = {}
+        self.agent_metadata: Dict[str, AgentMetadata] = {}
+        self.agent_instances: Dict[str, BaseSpecializedAgent] = {}
+        self.configuration: Dict[str, Any] = dict(_DEFAULT_CONFIG)
+        self._config_mtime: Optional[int] = _DEFAULT_CONFIG_MTIME
+        # agent_id -> (instantiable, error) for status reports, so classes are probed once
+        self._instantiable_cache: Dict[str, Tuple[bool, Optional[str]]] = {}
+        # Enabled agents, rebuilt after registrations and enable/disable
+        self._available_agents: Optional[Dict[str, AgentMetadata]] = None
+        
+        # Registry-wide term index for routing; rebuilt lazily after registrations
+        self._term_matcher: Optional[TermMatcher] = None
+        self._term_payloads: Dict[str, List[int]] = {}
+        self._word_payloads: Dict[str, List[int]] = {}
+        # Parallel arrays indexed by capability slot: owning agent and capability
+        self._slot_agents: List[str] = []
+        self._slot_capabilities: List[AgentCapability] = []
+        self._cached_confidences: Optional[Callable[[str], Dict[str, float]]] = None
+        # agent_id -> (lowest capability threshold, highest capability priority)
+        self._routing_bounds: Dict[str, Tuple[float, int]] = {}
+        # agent_id -> registration index, and position when ordered by descending max priority
+        self._registration_index: Dict[str, int] = {}
+        self._priority_rank: Dict[str, int] = {}
+        
+        # Register built-in agents
+        self._register_builtin_agents()
+    
+    def _load_configuration(self) -> bool:
+        """Reload agent registry configuration; returns False if the file is unchanged since the last load."""
+        try:
+            if os.stat(CONFIG_PATH).st_mtime_ns == self._config_mtime:
+                return False
+        except FileNotFoundError:
+            pass
+        
+        self._config_mtime, configuration = _read_configuration()
+        self.configuration = dict(configuration)
+        return True
+    
+    def _register_builtin_agents(self):
+        """Register built-in agents."""
+        # Register AWS Pricing Agent
+        try:
+            from .aws_pricing_agent import AWSPricingAgent
+            self.register_agent_class("aws_pricing", AWSPricingAgent)
+            logger.info("Registered built-in AWS Pricing Agent")
+        except ImportError as e:
+            logger.warning("Could not register AWS Pricing Agent: %s", e)
+    
+    def register_agent_class(self, agent_id: str, agent_class: Type[BaseSpecializedAgent]):
+        """Register a new agent class."""
+        if not issubclass(agent_class, BaseSpecializedAgent):
+            raise ValueError(f"Agent class must inherit from BaseSpecializedAgent")
+        
+        self.agents[agent_id] = agent_class
+        self._instantiable_cache.pop(agent_id, None)
+        
+        try:
+            metadata = agent_class.get_default_metadata()
+            self.agent_metadata[agent_id] = metadata
+            self._term_matcher = None
+            self._available_agents = None
+            logger.info("Registered agent: %s - %s", agent_id, metadata.description)
+        except Exception as e:
+            logger.error("Failed to get metadata for agent %s: %s", agent_id, e)
+    
+    def register_agent_instance(self, agent_id: str, agent_instance: BaseSpecializedAgent):
+        """Register a pre-configured agent instance."""
+        if not isinstance(agent_instance, BaseSpecializedAgent):
+            raise ValueError(f"Agent must inherit from BaseSpecializedAgent")
+        
+        self.agent_instances[agent_id] = agent_instance
+        metadata = agent_instance.get_metadata()
+        self.agent_metadata[agent_id] = metadata
+        self._term_matcher = None
+        self._available_agents = None
+        logger.info("Registered agent instance: %s - %s", agent_id, metadata.description)
+    
+    def register_agent_instances_bulk(self, agent_instances: Dict[str, BaseSpecializedAgent]):
+        """Register several pre-configured agent instances in a single update."""
+        for agent_id, agent_instance in agent_instances.items():
+            if not isinstance(agent_instance, BaseSpecializedAgent):
+                raise ValueError(f"Agent {agent_id} must inherit from BaseSpecializedAgent")
+        
+        metadata = {agent_id: agent_instance.get_metadata() for agent_id, agent_instance in agent_instances.items()}
+        self.agent_instances.update(agent_instances)
+        self.agent_metadata.update(metadata)
+        self._term_matcher = None
+        self._available_agents = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered %d agent instances: %s", len(agent_instances), ', '.join(agent_instances))
+    
+    def get_agent(self, agent_id: str) -> Optional[BaseSpecializedAgent]:
+        """Get an agent instance by ID."""
+        # Check if we have a pre-configured instance
+        if agent_id in self.agent_instances:
+            return self.agent_instances[agent_id]
+        
+        # Create new instance from class, unless it already failed since registration
+        if agent_id in self.agents and self._instantiable_cache.get(agent_id, (True, None))[0]:
+            try:
+                agent_config = self.configuration.get("agent_settings", {})
+                agent_instance = self.agents[agent_id](agent_config)
+                self.agent_instances[agent_id] = agent_instance
+                self._instantiable_cache[agent_id] = (True, None)
+                return agent_instance
+            except Exception as e:
+                logger.error("Failed to create agent instance %s: %s", agent_id, e)
+                self._instantiable_cache[agent_id] = (False, str(e))
+                return None
+        
+        return None
+    
+    def _build_term_index(self):
+        """
+        Index every capability term of every agent.
+        
+        Each capability gets a slot in flat parallel arrays, and each term maps
+        to the hit counters it bumps: 2 * slot for a keyword, 2 * slot + 1 for a
+        phrase. Whole-word keywords are indexed apart from substring terms.
+        """
+        payloads: Dict[str, List[int]] = {}
+        word_payloads: Dict[str, List[int]] = {}
+        bounds: Dict[str, Tuple[float, int]] = {}
+        slot_agents: List[str] = []
+        slot_capabilities: List[AgentCapability] = []
+        for agent_id, metadata in self.agent_metadata.items():
+            if metadata.capabilities:
+                bounds[agent_id] = (
+                    min(cap.confidence_threshold for cap in metadata.capabilities),
+                    max(cap.priority for cap in metadata.capabilities)
+                )
+            for capability in metadata.capabilities:
+                counter = 2 * len(slot_agents)
+                slot_agents.append(agent_id)
+                slot_capabilities.append(capability)
+                for keyword in capability._substring_keywords:
+                    payloads.setdefault(keyword, []).append(counter)
+                for keyword in capability._keyword_tokens:
+                    word_payloads.setdefault(keyword, []).append(counter)
+                # Terms are counted per list entry, duplicates included
+                for phrase in capability.phrases:
+                    payloads.setdefault(phrase, []).append(counter + 1)
+        
+        self._term_payloads = payloads
+        self._word_payloads = word_payloads
+        self._slot_agents = slot_agents
+        self._slot_capabilities = slot_capabilities
+        self._routing_bounds = bounds
+        self._registration_index = {agent_id: index for index, agent_id in enumerate(self.agent_metadata)}
+        by_priority = sorted(bounds, key=lambda agent_id: (-bounds[agent_id][1], self._registration_index[agent_id]))
+        self._priority_rank = {agent_id: rank for rank, agent_id in enumerate(by_priority)}
+        self._term_matcher = TermMatcher(payloads)
+        # Scores only change with the index, so the cache lives and dies with it
+        self._cached_confidences = lru_cache(maxsize=CONFIDENCE_CACHE_SIZE)(self._index_confidences)
+    
+    def _query_confidences(self, query_lower: str) -> Dict[str, float]:
+        """Per-agent confidences for a query, memoized so routing retries don't rescore it."""
+        if self._term_matcher is None:
+            self._build_term_index()
+        return self._cached_confidences(query_lower)
+    
+    def _index_confidences(self, query_lower: str) -> Dict[str, float]:
+        """
+        Confidence per agent from one pass of the term index over the query.
+        
+        Matches BaseSpecializedAgent.get_confidence_score for the registered
+        capabilities; agents with no matching term are absent (confidence 0).
+        """
+        payloads = self._term_payloads
+        counts: Dict[int, int] = {}
+        for term in self._term_matcher.matched_terms(query_lower):
+            for counter in payloads[term]:
+                counts[counter] = counts.get(counter, 0) + 1
+        word_payloads = self._word_payloads
+        if word_payloads:
+            for word in _query_words(query_lower) & word_payloads.keys():
+                for counter in word_payloads[word]:
+                    counts[counter] = counts.get(counter, 0) + 1
+        
+        confidences: Dict[str, float] = {}
+        slot_agents = self._slot_agents
+        slot_capabilities = self._slot_capabilities
+        for slot in {counter >> 1 for counter in counts}:
+            keyword_matches = counts.get(2 * slot, 0)
+            phrase_matches = counts.get(2 * slot + 1, 0)
+            agent_id = slot_agents[slot]
+            best_score = confidences.get(agent_id, 0.0)
+            if best_score >= 1.0:
+                continue  # Already at the clamp; the agent's other capabilities can't change it
+            score = _capability_score(slot_capabilities[slot], keyword_matches, phrase_matches)
+            if score > best_score:
+                confidences[agent_id] = score
+        
+        return {agent_id: min(score, 1.0) for agent_id, score in confidences.items()}
+    
+    def find_best_agent(self, query: str, exclude_agents: List[str] = None) -> Optional[str]:
+        """Find the best agent to handle a query based on capabilities and confidence."""
+        return self.find_best_agent_with_score(query, exclude_agents)[0]
+    
+    def find_best_agent_with_score(self, query: str, exclude_agents: List[str] = None) -> Tuple[Optional[str], float]:
+        """
+        Find the best agent for a query along with its confidence score.
+        
+        Returns:
+            (agent_id, confidence) - the unweighted confidence of the selected agent,
+            or (None, 0.0) if no agent qualifies
+        """
+        exclude_agents = exclude_agents or []
+        best_agent = None
+        best_score = 0.0
+        best_confidence = 0.0
+        best_index = 0
+        
+        # Score every agent's registered capabilities in one pass over the query;
+        # agents with no term in it have zero confidence and can never win
+        confidences = self._query_confidences(query.lower())
+        
+        # Highest max priority first: confidence is at most 1.0, so no agent can
+        # outscore its max_priority / 10 and the rest can be cut off
+        for agent_id in sorted(confidences, key=self._priority_rank.__getitem__):
+            min_confidence, max_priority = self._routing_bounds[agent_id]
+            if max_priority / 10.0 < best_score:
+                break
+            
+            if agent_id in exclude_agents or not self.agent_metadata[agent_id].enabled:
+                continue
+            
+            # Check if confidence meets threshold
+            confidence = confidences[agent_id]
+            if confidence < min_confidence:
+                continue
+            
+            # Weight by priority; equal scores go to the earlier-registered agent
+            weighted_score = confidence * (max_priority / 10.0)
+            index = self._registration_index[agent_id]
+            if weighted_score < best_score or weighted_score <= 0.0:
+                continue
+            if weighted_score == best_score and index > best_index:
+                continue
+            
+            if not self.get_agent(agent_id):
+                continue
+            
+            best_score = weighted_score
+            best_confidence = confidence
+            best_agent = agent_id
+            best_index = index
+        
+        if best_agent:
+            logger.info("Selected agent %s with confidence %.2f", best_agent, best_score)
+        
+        return best_agent, best_confidence
+    
+    def find_best_agents(self, queries: Iterable[str], exclude_agents: List[str] = None) -> List[Optional[str]]:
+        """
+        Find the best agent for each of several queries, as find_best_agent would.
+        
+        Agent eligibility is resolved once for the whole batch, each query only
+        visits the agents its terms hit, and repeated queries share one scoring.
+        """
+        exclude_agents = set(exclude_agents or ())
+        # Registration order breaks ties, as in find_best_agent
+        rank = {
+            agent_id: index for index, (agent_id, metadata) in enumerate(self.agent_metadata.items())
+            if metadata.enabled and agent_id not in exclude_agents
+        }
+        loadable: Dict[str, bool] = {}
+        
+        selections = []
+        for query in queries:
+            best_agent = None
+            best_key = (0.0, 0)
+            for agent_id, confidence in self._query_confidences(query.lower()).items():
+                if agent_id not in rank:
+                    continue
+                min_confidence, max_priority = self._routing_bounds[agent_id]
+                if confidence < min_confidence:
+                    continue
+                key = (confidence * (max_priority / 10.0), -rank[agent_id])
+                if key[0] <= 0.0 or key <= best_key:
+                    continue
+                if agent_id not in loadable:
+                    loadable[agent_id] = self.get_agent(agent_id) is not None
+                if loadable[agent_id]:
+                    best_agent, best_key = agent_id, key
+            selections.append(best_agent)
+        
+        return selections
+    
+    def get_available_agents(self) -> Dict[str, AgentMetadata]:
+        """Get all available agents and their metadata (a shared view; don't modify it)."""
+        if self._available_agents is None:
+            self._available_agents = {aid: meta for aid, meta in self.agent_metadata.items() if meta.enabled}
+        return self._available_agents
+    
+    def get_agent_capabilities(self, agent_id: str) -> Tuple[AgentCapability, ...]:
+        """Get capabilities for a specific agent."""
+        if agent_id in self.agent_metadata:
+            return self.agent_metadata[agent_id].capabilities
+        return ()
+    
+    def enable_agent(self, agent_id: str):
+        """Enable an agent."""
+        if agent_id in self.agent_metadata:
+            self.agent_metadata[agent_id] = replace(self.agent_metadata[agent_id], enabled=True)
+            self._available_agents = None
+            logger.info("Enabled agent: %s", agent_id)
+    
+    def disable_agent(self, agent_id: str):
+        """Disable an agent."""
+        if agent_id in self.agent_metadata:
+            self.agent_metadata[agent_id] = replace(self.agent_metadata[agent_id], enabled=False)
+            self._available_agents = None
+            logger.info("Disabled agent: %s", agent_id)
+    
+    def get_agent_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all registered agents."""
+        status = {}
+        
+        for agent_id, metadata in self.agent_metadata.items():
+            agent_status = {
+                "name": metadata.name,
+                "description": metadata.description,
+                "version": metadata.version,
+                "enabled": metadata.enabled,
+                "capabilities": len(metadata.capabilities),
+                "instance_loaded": agent_id in self.agent_instances
+            }
+            
+            # Check if agent can be instantiated (probed once per registered class)
+            if agent_id in self.agents and agent_id not in self.agent_instances:
+                if agent_id not in self._instantiable_cache:
+                    try:
+                        # Close the probe instance so it leaves nothing running
+                        with self.agents[agent_id]({}):
+                            pass
+                        self._instantiable_cache[agent_id] = (True, None)
+                    except Exception as e:
+                        self._instantiable_cache[agent_id] = (False, str(e))
+                instantiable, error = self._instantiable_cache[agent_id]
+                agent_status["instantiable"] = instantiable
+                if error is not None:
+                    agent_status["error"] = error
+            else:
+                agent_status["instantiable"] = True
+            
+            status[agent_id] = agent_status
+        
+        return status
+    
+    def reload_configuration(self):
+        """Reload agent configuration from file."""
+        if self._load_configuration():
+            logger.info("Reloaded agent registry configuration")
+        else:
+            logger.info("Agent registry configuration unchanged, skipped reload")
+    
+    def export_configuration(self, filepath: str):
+        """Export current configuration to file."""
+        config = {
+            "agents": {
+                agent_id: {
+                    "name": metadata.name,
+                    "description": metadata.description,
+                    "version": metadata.version,
+                    "author": metadata.author,
+                    "enabled": metadata.enabled,
+                    # Built explicitly: the derived match-term fields aren't part of the config
+                    "capabilities": [
+                        {
+                            "name": cap.name,
+                            "description": cap.description,
+                            "keywords": cap.keywords,
+                            "phrases": cap.phrases,
+                            "priority": cap.priority,
+                            "confidence_threshold": cap.confidence_threshold,
+                            "whole_words": cap.whole_words
+                        }
+                        for cap in metadata.capabilities
+                    ],
+                    "model_config": metadata.model_config,
+                    "tools_required": metadata.tools_required,
+                    "mcp_servers": metadata.mcp_servers,
+                    "dependencies": metadata.dependencies
+                }
+                for agent_id, metadata in self.agent_metadata.items()
+            },
+            "configuration": self.configuration
+        }
+        
+        with open(filepath, 'wb') as f:
+            f.write(_json_dumps_indented(config))
+        
+        logger.info("Exported agent configuration to %s", filepath)
+
+# Global registry instance, created on first access so importing this module
+# (e.g. just for BaseSpecializedAgent) doesn't load the built-in agents
+_agent_registry: Optional[AgentRegistry] = None
+
+def __getattr__(name: str):
+    """Resolve the lazily created ``agent_registry`` module attribute (PEP 562)."""
+    global _agent_registry
+    if name == 'agent_registry':
+        if _agent_registry is None:
+            _agent_registry = AgentRegistry()
+        return _agent_registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_agent_registry() -> AgentRegistry:
+    """Get the global agent registry instance."""
+    return __getattr__('agent_registry')
\ No newline at end of file